@@ -2,15 +2,46 @@
 API routes for card-related endpoints.
 """
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi_cache.decorator import cache
 
 from app.models.card import CardModel
+from app.services.card_database import CardDatabase
 
 router = APIRouter()
 
 
+def get_card_db(request: Request) -> CardDatabase:
+    """
+    Dependency returning the CardDatabase once its background load is done.
+
+    Raises:
+        HTTPException: 503 if the card database is still loading or failed to load
+    """
+    task = request.app.state.card_db_task
+
+    if not task.done():
+        raise HTTPException(
+            status_code=503,
+            detail="Card database is still loading, please retry shortly"
+        )
+
+    # The failure itself is logged by the startup task
+    if task.cancelled() or task.exception() is not None:
+        raise HTTPException(
+            status_code=503,
+            detail="Card database failed to load"
+        )
+
+    return task.result()
+
+
 @router.get("/{card_id}")
-async def get_card_by_id(card_id: str, request: Request) -> CardModel:
+@cache(expire=3600)
+async def get_card_by_id(
+    card_id: str,
+    card_db: CardDatabase = Depends(get_card_db)
+) -> CardModel:
     """
     Get a card by its Scryfall ID.
 
@@ -23,22 +54,23 @@ async def get_card_by_id(card_id: str, request: Request) -> CardModel:
     Raises:
         HTTPException: 404 if card not found
     """
-    # Access the CardDatabase from app state
-    card_db = request.app.state.card_db
+    card = card_db.get_card_by_id(card_id)
 
-    # Search for the card by ID
-    for card in card_db.cards:
-        if card.id == card_id:
-            return card
+    if not card:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Card with ID '{card_id}' not found"
+        )
 
-    raise HTTPException(
-        status_code=404,
-        detail=f"Card with ID '{card_id}' not found"
-    )
+    return card
 
 
 @router.get("/name/{card_name}")
-async def get_card_by_name(card_name: str, request: Request) -> CardModel:
+@cache(expire=3600)
+async def get_card_by_name(
+    card_name: str,
+    card_db: CardDatabase = Depends(get_card_db)
+) -> CardModel:
     """
     Get a card by its exact name.
 
@@ -51,7 +83,6 @@ async def get_card_by_name(card_name: str, request: Request) -> CardModel:
     Raises:
         HTTPException: 404 if card not found
     """
-    card_db = request.app.state.card_db
     card = card_db.get_card_by_name(card_name)
 
     if not card:
@@ -66,8 +97,8 @@ async def get_card_by_name(card_name: str, request: Request) -> CardModel:
 @router.get("/search/{query}")
 async def search_cards(
     query: str,
-    request: Request,
-    limit: int = 10
+    limit: int = 10,
+    card_db: CardDatabase = Depends(get_card_db)
 ) -> list[CardModel]:
     """
     Search for cards by name (case-insensitive partial match).
@@ -79,7 +110,6 @@ async def search_cards(
     Returns:
         List of matching card data models
     """
-    card_db = request.app.state.card_db
     results = card_db.search_cards(query, limit=limit)
 
     return results
@@ -2,7 +2,8 @@
 API routes for cube-related endpoints.
 """
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi_cache.decorator import cache
 
 from app.models.cube import CubeModel, CubeSummaryModel
 from app.services.cube_database import CubeDatabase
@@ -11,23 +12,29 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[CubeSummaryModel])
-async def get_all_cubes(request: Request) -> list[CubeSummaryModel]:
+async def get_all_cubes(request: Request) -> Response:
     """
     Get a list of all cubes with their IDs and names.
 
+    The response body is pre-encoded by the CubeDatabase, so it is returned
+    as-is without per-request serialization.
+
     Returns:
         List of cube summaries containing ID and name
 
     Example:
         GET /api/v1/cubes/
         Response: [
-            {"id": "1fdv1", "name": "My Cube"},
-            {"id": "5h3k2", "name": "Vintage Cube"},
-            {"id": "abcde", "name": "Modern Cube"}
+            {"shortId": "1fdv1", "name": "My Cube"},
+            {"shortId": "5h3k2", "name": "Vintage Cube"},
+            {"shortId": "abcde", "name": "Modern Cube"}
         ]
     """
     cube_db: CubeDatabase = request.app.state.cube_db
-    return cube_db.get_all_cube_summaries()
+    return Response(
+        content=cube_db.get_all_cube_summaries_json(),
+        media_type="application/json",
+    )
 
 
 @router.get("/search/{query}", response_model=list[CubeModel])
@@ -50,6 +57,7 @@ async def search_cubes(query: str, request: Request, limit: int = 10) -> list[Cu
 
 
 @router.get("/stats/count")
+@cache(expire=300)
 async def get_cube_count(request: Request) -> dict[str, int]:
     """
     Get the total number of cubes in the database.
@@ -65,11 +73,14 @@ async def get_cube_count(request: Request) -> dict[str, int]:
     return {"count": cube_db.get_cube_count()}
 
 
-@router.get("/{cube_id}")
-async def get_cube_by_id(cube_id: str, request: Request) -> CubeModel:
+@router.get("/{cube_id}", response_model=CubeModel)
+async def get_cube_by_id(cube_id: str, request: Request) -> Response:
     """
     Get a cube by its CubeCobra identifier.
 
+    The cube is serialized straight to JSON by pydantic-core, skipping the
+    intermediate dict and response model revalidation.
+
     Args:
         cube_id: The CubeCobra cube ID (e.g., "1fdv1")
 
@@ -97,4 +108,7 @@ async def get_cube_by_id(cube_id: str, request: Request) -> CubeModel:
             detail=f"Cube with ID '{cube_id}' not found"
         )
 
-    return cube_data
+    return Response(
+        content=cube_data.model_dump_json(by_alias=True),
+        media_type="application/json",
+    )
@@ -2,8 +2,14 @@
 API routes for recommender-related endpoints.
 """
 
-from fastapi import APIRouter, HTTPException, Request
+import asyncio
+from functools import lru_cache
 
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi_cache.decorator import cache
+
+from app.core import settings
+from app.models.cube import CUBE_ADAPTER, CubeModel
 from app.models.recommender import (
     CubeBasedCollaborativeFilteringConfig,
     RecommenderAlgorithmInfo,
@@ -15,10 +21,14 @@ from app.services.recommender import CubeBasedCollaborativeFilteringRecommender
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_available_algorithms() -> list[RecommenderAlgorithmInfo]:
     """
     Get metadata for all available recommender algorithms.
 
+    The metadata is static, so it is built once and the JSON schemas are
+    not regenerated on subsequent calls.
+
     Returns:
         List of algorithm information including schemas and defaults
     """
@@ -44,7 +54,101 @@ def get_available_algorithms() -> list[RecommenderAlgorithmInfo]:
     return algorithms
 
 
+def _get_training_cubes(request: Request) -> list[CubeModel]:
+    """
+    Get the cubes used to fit recommenders, loading them on first use.
+
+    Cubes are read straight from the in-memory CubeDatabase index, so no
+    per-cube awaits are needed. The loaded list is kept on app state so that
+    fitting a recommender for a new configuration does not reload every cube.
+
+    Args:
+        request: FastAPI request object for accessing app state
+
+    Returns:
+        List of training cubes
+
+    Raises:
+        HTTPException: 400 if no cubes are cached
+    """
+    if request.app.state.training_cubes is not None:
+        return request.app.state.training_cubes
+
+    cube_db = request.app.state.cube_db
+
+    # Get all cached cubes for training
+    cached_cube_ids = cube_db.get_all_cube_ids()
+
+    if not cached_cube_ids:
+        raise HTTPException(
+            status_code=400,
+            detail="No cubes available for training. Please ensure at least some cubes are cached.",
+        )
+
+    # The index holds CubeModel instances that were validated when the cube
+    # data was loaded, so they are used as-is without revalidating each one
+    training_cubes = [cube_db.get_cube(cube_id) for cube_id in cached_cube_ids]
+
+    request.app.state.training_cubes = training_cubes
+    return training_cubes
+
+
+async def _get_fitted_recommender(
+    request: Request,
+    algorithm_config: CubeBasedCollaborativeFilteringConfig,
+) -> CubeBasedCollaborativeFilteringRecommender:
+    """
+    Get a recommender fitted with the given configuration.
+
+    Fitted recommenders are reused across requests with the same
+    configuration. Fitting runs in a worker thread so it does not block the
+    event loop, and concurrent requests for a configuration that is still
+    being fitted wait on the same fit instead of each starting their own.
+
+    Args:
+        request: FastAPI request object for accessing app state
+        algorithm_config: Algorithm configuration to fit with
+
+    Returns:
+        Fitted recommender
+    """
+    state = request.app.state
+    fitted_recommenders = state.fitted_recommenders
+    config_key = algorithm_config.model_dump_json()
+
+    recommender = fitted_recommenders.get(config_key)
+    if recommender is not None:
+        fitted_recommenders.move_to_end(config_key)
+        return recommender
+
+    fit_task = state.pending_fits.get(config_key)
+    if fit_task is None:
+        recommender = CubeBasedCollaborativeFilteringRecommender(config=algorithm_config)
+        fit_task = asyncio.create_task(
+            asyncio.to_thread(recommender.fit, _get_training_cubes(request))
+        )
+        state.pending_fits[config_key] = fit_task
+
+        def _store_fitted(task: asyncio.Task) -> None:
+            del state.pending_fits[config_key]
+            if task.cancelled() or task.exception() is not None:
+                return
+            fitted_recommenders[config_key] = task.result()
+
+            # Each fitted model holds its own cube-card matrix, so only the
+            # most recently used configurations are kept
+            while len(fitted_recommenders) > settings.fitted_recommender_cache_size:
+                fitted_recommenders.popitem(last=False)
+
+        fit_task.add_done_callback(_store_fitted)
+
+    # Shielded so that one client disconnecting does not cancel the fit
+    # for every other request waiting on it
+    return await asyncio.shield(fit_task)
+
+
 @router.get("/algorithms", response_model=list[RecommenderAlgorithmInfo])
+@cache(expire=3600)
 async def list_algorithms() -> list[RecommenderAlgorithmInfo]:
     """
     Get a list of all available recommender algorithms with their configurations.
@@ -79,7 +183,7 @@ async def list_algorithms() -> list[RecommenderAlgorithmInfo]:
 async def generate_recommendations(
     request_body: RecommendationRequest,
     request: Request,
-) -> RecommendationResponse:
+) -> Response:
     """
     Generate card recommendations for a cube using a specified algorithm.
 
@@ -119,57 +223,27 @@ async def generate_recommendations(
 
     try:
         # Fetch the cube data
-        cube_data = await cube_db.get_cube(request_body.cube_id)
+        cube_data = cube_db.get_cube(request_body.cube_id)
+
+        if cube_data is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Cube with ID '{request_body.cube_id}' not found",
+            )
 
         # Validate cube data
-        from app.models.cube import CubeModel
-        cube = CubeModel.model_validate(cube_data)
+        cube = CUBE_ADAPTER.validate_python(cube_data)
 
         # Create recommender based on algorithm type
         algorithm_config = request_body.algorithm_config
 
-        if algorithm_config.type == "cube_based_collaborative_filtering":
-            recommender = CubeBasedCollaborativeFilteringRecommender(
-                config=algorithm_config
-            )
-        else:
+        if algorithm_config.type != "cube_based_collaborative_filtering":
             raise HTTPException(
                 status_code=400,
                 detail=f"Unknown algorithm type: {algorithm_config.type}",
             )
 
-        # Check if we have a fitted recommender in app state
-        # For now, we'll need to fit on-demand (in production, you'd cache fitted models)
-        if not hasattr(request.app.state, "fitted_recommenders"):
-            request.app.state.fitted_recommenders = {}
-
-        # Get all cached cubes for training
-        cached_cube_ids = cube_db.get_cached_cube_ids()
-
-        if not cached_cube_ids:
-            raise HTTPException(
-                status_code=400,
-                detail="No cubes available for training. Please ensure at least some cubes are cached.",
-            )
-
-        # Load all cached cubes for fitting
-        training_cubes = []
-        for cube_id in cached_cube_ids:
-            try:
-                cube_data_train = await cube_db.get_cube(cube_id)
-                training_cubes.append(CubeModel.model_validate(cube_data_train))
-            except Exception:
-                # Skip cubes that fail to load
-                continue
-
-        if not training_cubes:
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to load training cubes",
-            )
-
-        # Fit the recommender
-        recommender.fit(training_cubes)
+        recommender = await _get_fitted_recommender(request, algorithm_config)
 
         # Generate recommendations
         recommendations = recommender.recommend(
@@ -177,13 +251,21 @@ async def generate_recommendations(
             n_recommendations=request_body.n_recommendations,
         )
 
-        return RecommendationResponse(
+        response = RecommendationResponse(
             cube_id=request_body.cube_id,
             algorithm_type=algorithm_config.type,
             recommendations=recommendations,
             n_recommendations=len(recommendations),
         )
 
+        # Serialized straight to JSON, skipping response model revalidation
+        return Response(
+            content=response.model_dump_json(),
+            media_type="application/json",
+        )
+
+    except HTTPException:
+        raise
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
@@ -0,0 +1,41 @@
+"""
+Response caching helpers built on fastapi-cache2.
+
+Route handlers receive the FastAPI ``Request`` object or injected services
+such as the CardDatabase. The request differs on every call, so the default
+key builder would never produce a cache hit; the builder here keys only on
+the plain path and query parameters.
+"""
+
+import hashlib
+from typing import Any, Callable
+
+from fastapi import Request, Response
+
+CACHE_PREFIX = "cubepy"
+
+
+def request_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Request | None = None,
+    response: Response | None = None,
+    args: tuple[Any, ...] = (),
+    kwargs: dict[str, Any] | None = None,
+) -> str:
+    """
+    Build a cache key from the endpoint and its plain-valued arguments.
+
+    Requests and injected dependencies are left out of the key.
+
+    Returns:
+        Cache key string unique to the endpoint and its call arguments
+    """
+    params = {
+        name: value
+        for name, value in (kwargs or {}).items()
+        if value is None or isinstance(value, (str, int, float, bool))
+    }
+    raw_key = f"{func.__module__}:{func.__name__}:{sorted(params.items())}"
+    return f"{namespace}:{hashlib.md5(raw_key.encode()).hexdigest()}"
@@ -18,6 +18,9 @@ class Settings(BaseSettings):
     # External API Settings
     scryfall_api_url: str = "https://api.scryfall.com"
 
+    # Recommender Settings
+    fitted_recommender_cache_size: int = 8
+
     class Config:
         case_sensitive = True
 
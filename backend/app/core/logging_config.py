@@ -0,0 +1,38 @@
+"""
+Logging configuration for the application.
+
+Log records are handed to a queue and written to stdout by a background
+listener thread, so logging calls never block the event loop on I/O.
+"""
+
+import logging
+import logging.handlers
+import queue
+
+
+def configure_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route application log records through a queue to a stdout handler.
+
+    Args:
+        level: Minimum level for the application loggers
+
+    Returns:
+        The started QueueListener; call stop() on shutdown to flush it
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(level)
+    app_logger.handlers.clear()
+    app_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    app_logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
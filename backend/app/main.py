@@ -1,40 +1,87 @@
+import asyncio
+import logging
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
 
 from app.core import settings
+from app.core.cache import CACHE_PREFIX, request_key_builder
+from app.core.logging_config import configure_logging
 from app.api.health import router as health_router
 from app.api.cards import router as cards_router
 from app.api.cubes import router as cubes_router
 from app.api.recommenders import router as recommenders_router
+from app.models import build_model_validators
 from app.services.card_database import CardDatabase
 from app.services.cube_database import CubeDatabase
 
+logger = logging.getLogger(__name__)
+
+
+async def _load_card_db() -> CardDatabase:
+    """Load the CardDatabase, logging progress and any failure."""
+    logger.info("Initializing CardDatabase...")
+    try:
+        card_db = await CardDatabase.create()
+    except Exception:
+        # Nothing awaits this task, so log here; card endpoints report the
+        # failure as a 503 through get_card_db
+        logger.exception("CardDatabase failed to load")
+        raise
+    logger.info("CardDatabase initialized successfully")
+    return card_db
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
+    log_listener = configure_logging()
+
+    # Models defer building their validators; build them all up front
+    build_model_validators()
+
+    # Initialize CardDatabase in the background so startup only waits for
+    # the CubeDatabase below; card endpoints return 503 until it is ready
+    app.state.card_db_task = asyncio.create_task(_load_card_db())
+
+    # Initialize CubeDatabase in a worker thread: its disk/S3 reads and JSON
+    # parsing are blocking, and the event loop must stay free meanwhile so
+    # the card database download above keeps making progress
+    logger.info("Initializing CubeDatabase...")
+    app.state.cube_db = await asyncio.to_thread(CubeDatabase)
+    logger.info("CubeDatabase initialized successfully")
 
-    # Initialize CardDatabase
-    print("Initializing CardDatabase...")
-    app.state.card_db = await CardDatabase.create()
-    print("CardDatabase initialized successfully")
+    # Fitted recommenders are cached per algorithm configuration, least
+    # recently used first, together with the cubes they were fitted on and
+    # any fits still in progress
+    app.state.fitted_recommenders = OrderedDict()
+    app.state.training_cubes = None
+    app.state.pending_fits = {}
 
-    # Initialize CubeDatabase
-    print("Initializing CubeDatabase...")
-    app.state.cube_db = CubeDatabase()
-    print("CubeDatabase initialized successfully")
+    # Initialize response cache for read-only endpoints
+    FastAPICache.init(
+        InMemoryBackend(),
+        prefix=CACHE_PREFIX,
+        key_builder=request_key_builder,
+    )
 
     yield
     # Shutdown
-    # Add cleanup logic here if needed
+    app.state.card_db_task.cancel()
+    await CardDatabase.close_client()
+    log_listener.stop()
 
 
 app = FastAPI(
     title=settings.project_name,
     version=settings.version,
     openapi_url=f"{settings.api_v1_prefix}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
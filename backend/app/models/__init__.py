@@ -1,7 +1,34 @@
 # Import all models here so they are registered with SQLModel
 # Example:
 # from app.models.card import Card
-from app.models.card import CardModel
-from app.models.cube import CubeModel
+from app.models.card import CARD_ADAPTER, CardModel
+from app.models.cube import CUBE_ADAPTER, CubeModel, CubeSummaryModel
+from app.models.recommender import (
+    CubeBasedCollaborativeFilteringConfig,
+    RecommendationRequest,
+    RecommendationResponse,
+    RecommenderAlgorithmInfo,
+)
 
-__all__ = ["CardModel", "CubeModel"]
+__all__ = ["CardModel", "CubeModel", "build_model_validators"]
+
+
+def build_model_validators() -> None:
+    """
+    Build the validators of all models that defer building until first use.
+
+    Called once at app startup, so the cost is paid there rather than on
+    import or by the first request that touches each model.
+    """
+    for model in (
+        CardModel,
+        CubeModel,
+        CubeSummaryModel,
+        CubeBasedCollaborativeFilteringConfig,
+        RecommendationRequest,
+        RecommendationResponse,
+        RecommenderAlgorithmInfo,
+    ):
+        model.model_rebuild()
+    CARD_ADAPTER.rebuild()
+    CUBE_ADAPTER.rebuild()
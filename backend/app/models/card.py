@@ -5,7 +5,7 @@ These models are used for API responses and data validation,
 primarily for Scryfall API data.
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, ValidationInfo, field_validator
 
 
 class CardModel(BaseModel):
@@ -60,13 +60,26 @@ class CardModel(BaseModel):
         default_factory=dict, description="Card prices in various currencies"
     )
 
+    @field_validator("legalities")
+    @classmethod
+    def _share_legalities(cls, legalities: dict[str, str], info: ValidationInfo) -> dict[str, str]:
+        # Most cards share one of a few legality combinations. A caller
+        # validating many cards can pass a "legalities" dict in the context,
+        # keyed by items, so those cards reference one canonical (read-only)
+        # dict instead of each holding its own copy.
+        canonical = info.context.get("legalities") if info.context else None
+        if canonical is None:
+            return legalities
+        return canonical.setdefault(tuple(legalities.items()), legalities)
 
     model_config = ConfigDict(
         extra='ignore',             # or 'forbid' if you must, but 'ignore' can be slightly cheaper than complex logic
         validate_assignment=False,  # only needed if you assign after creation
-        frozen=False,
+        validate_default=False,     # defaults are trusted, skip validating them
+        frozen=True,                # cached instances are shared across requests
         arbitrary_types_allowed=False,  # if you don’t need arbitrary types
         revalidate_instances='never',   # if you pass already-valid instances around
+        defer_build=True,           # validators are built at app startup, not on import
         json_schema_extra = {
             "example": {
                 "id": "f2b9983e-20d4-4d12-9e2c-ec6d9a345787",
@@ -88,3 +101,7 @@ class CardModel(BaseModel):
             }
         }
     )
+
+
+# Validator built once (at app startup) and reused by every card load
+CARD_ADAPTER = TypeAdapter(CardModel)
@@ -5,7 +5,37 @@ These models are used for API responses and data validation,
 primarily for CubeCobra cube data.
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Annotated, Any
+
+import numpy as np
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    PlainSerializer,
+    PlainValidator,
+    TypeAdapter,
+    WithJsonSchema,
+)
+
+
+def _to_card_id_array(value) -> np.ndarray:
+    """Coerce an incoming card ID sequence to a compact int32 array."""
+    return np.asarray(value, dtype=np.int32)
+
+
+def _empty_card_id_array() -> np.ndarray:
+    return np.empty(0, dtype=np.int32)
+
+
+# Card IDs are stored as int32 arrays (4 bytes per ID instead of a boxed int)
+# but validated from, serialized to and documented as a plain list of ints.
+CardIdArray = Annotated[
+    np.ndarray,
+    PlainValidator(_to_card_id_array),
+    PlainSerializer(lambda ids: ids.tolist(), return_type=list[int]),
+    WithJsonSchema({"type": "array", "items": {"type": "integer"}}),
+]
 
 
 class CubeSummaryModel(BaseModel):
@@ -19,15 +49,18 @@ class CubeSummaryModel(BaseModel):
     id: str = Field(..., alias="shortId", description="CubeCobra unique cube ID")
     name: str = Field(..., description="Cube name")
 
-    model_config = {
-        "populate_by_name": True,
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        frozen=True,
+        revalidate_instances='never',
+        defer_build=True,
+        populate_by_name=True,
+        json_schema_extra = {
             "example": {
                 "id": "1fdv1",
                 "name": "My Awesome Cube",
             }
         }
-    }
+    )
 
 
 class CubeModel(BaseModel):
@@ -55,8 +88,8 @@ class CubeModel(BaseModel):
     tags: list[str] = Field(default_factory=list, description="Cube tags")
 
     # Card list (simplified for now - can be expanded later)
-    card_ids: list[int] = Field(
-        alias="cards", default_factory=list, description="List of cards in the cube"
+    card_ids: CardIdArray = Field(
+        alias="cards", default_factory=_empty_card_id_array, description="List of cards in the cube"
     )
 
     # Metadata
@@ -67,9 +100,11 @@ class CubeModel(BaseModel):
     model_config = ConfigDict(
         extra='ignore',             # or 'forbid' if you must, but 'ignore' can be slightly cheaper than complex logic
         validate_assignment=False,  # only needed if you assign after creation
-        frozen=False,
+        validate_default=False,     # defaults are trusted, skip validating them
+        frozen=True,                # indexed instances are shared across requests
         arbitrary_types_allowed=False,  # if you don’t need arbitrary types
         revalidate_instances='never',   # if you pass already-valid instances around
+        defer_build=True,           # validators are built at app startup, not on import
         populate_by_name=True,
         json_schema_extra = {
             "example": {
@@ -88,3 +123,42 @@ class CubeModel(BaseModel):
             }
         }
     )
+
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ compares field dicts, which is ambiguous for
+        # the card ID array, so compare it element-wise instead.
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        if type(self) is not type(other):
+            return False
+        mine = {k: v for k, v in self.__dict__.items() if k != "card_ids"}
+        theirs = {k: v for k, v in other.__dict__.items() if k != "card_ids"}
+        return mine == theirs and np.array_equal(self.card_ids, other.card_ids)
+
+    def __hash__(self) -> int:
+        # Only hashable, eq-consistent fields: list fields and the array
+        # cannot be hashed directly.
+        return hash((self.id, self.card_ids.tobytes()))
+
+
+# Validator built once (at app startup) and reused by every call site
+CUBE_ADAPTER = TypeAdapter(CubeModel)
+
+
+def construct_cube(row: dict[str, Any]) -> CubeModel:
+    """
+    Build a CubeModel from a trusted cube dump record without validating it.
+
+    Only the card IDs are converted, since the rest of the codebase relies on
+    them being an int32 array. Fields the model does not declare are dropped.
+
+    Args:
+        row: Raw cube dictionary, keyed by field aliases
+
+    Returns:
+        The constructed CubeModel
+    """
+    cards = row.get("cards")
+    if cards is not None:
+        row = {**row, "cards": _to_card_id_array(cards)}
+    return CubeModel.model_construct(**row)
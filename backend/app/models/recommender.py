@@ -44,6 +44,7 @@ class CubeBasedCollaborativeFilteringConfig(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "example": {
                 "type": "cube_based_collaborative_filtering",
@@ -78,6 +79,7 @@ class RecommenderAlgorithmInfo(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "example": {
                 "type": "cube_based_collaborative_filtering",
@@ -106,7 +108,7 @@ class RecommendationRequest(BaseModel):
 
     cube_id: str = Field(..., description="CubeCobra cube ID")
     algorithm_config: RecommenderConfig = Field(
-        default=CubeBasedCollaborativeFilteringConfig(),
+        default_factory=CubeBasedCollaborativeFilteringConfig,
         description="Algorithm configuration (defaults to cube-based collaborative filtering)"
     )
     n_recommendations: int = Field(
@@ -117,6 +119,7 @@ class RecommendationRequest(BaseModel):
     )
 
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "example": {
                 "cube_id": "1fdv1",
@@ -148,14 +151,14 @@ class RecommendationResponse(BaseModel):
     n_recommendations: int = Field(..., description="Number of recommendations returned")
 
     model_config = {
+        "defer_build": True,
         "json_schema_extra": {
             "example": {
                 "cube_id": "1fdv1",
                 "algorithm_type": "cube_based_collaborative_filtering",
                 "recommendations": [
                     {
-                        "card_id": "b34bb2dc-c1af-4d77-b0b3-a0fb342a5fc6",
-                        "card_name": "Lightning Bolt",
+                        "card_id": 14072,
                         "score": 0.85,
                         "reason": "Appears in 42/50 similar cubes"
                     }
@@ -5,15 +5,20 @@ This module provides a CardDatabase class that automatically downloads and cache
 the Scryfall Oracle Cards dataset when instantiated.
 """
 
-import json
+import asyncio
 from pathlib import Path
 from typing import Any
 
 import httpx
-from pydantic import TypeAdapter
 
 from app.core.config import settings
-from app.models.card import CardModel
+from app.models.card import CARD_ADAPTER, CardModel
+from app.services.name_index import NameIndex
+from app.services.raw_data import build_in_place, intern_repeated_values, read_json_file
+
+# Default data directory: backend/data/cards relative to the project root
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DEFAULT_DATA_DIR = PROJECT_ROOT / "backend" / "data" / "cards"
 
 
 class CardDatabase:
@@ -33,6 +38,9 @@ class CardDatabase:
         oracle_cards_path: Path to the oracle-cards.json file
         version_path: Path to the version.txt file tracking the data version
         cards: List of CardModel instances loaded from the Oracle Cards file
+        cards_by_id: Dictionary mapping Scryfall card IDs to cards for fast lookup
+        cards_by_name: Dictionary mapping exact card names to cards
+        cards_by_oracle_id: Dictionary mapping Oracle IDs to all matching cards
 
     Example:
         ```python
@@ -49,6 +57,20 @@ class CardDatabase:
     ORACLE_CARDS_TYPE = "oracle_cards"
     ORACLE_CARDS_FILENAME = "oracle-cards.json"
     VERSION_FILENAME = "version.txt"
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    PROGRESS_INTERVAL = 10 * 1024 * 1024
+
+    # Low-cardinality card fields interned at load, so cards sharing a set,
+    # rarity or type line share one str object
+    _INTERNED_KEYS = ("set", "set_name", "rarity", "type_line", "mana_cost", "power", "toughness", "loyalty")
+    _INTERNED_LIST_KEYS = ("colors", "color_identity", "keywords")
+
+    # Shared HTTP client, created on first use and closed with close_client()
+    _client: httpx.AsyncClient | None = None
+
+    # Loaded databases by data directory, populated by create()
+    _instances: dict[Path, "CardDatabase"] = {}
+    _create_lock = asyncio.Lock()
 
     def __init__(self, data_dir: Path | None = None):
         """
@@ -61,16 +83,15 @@ class CardDatabase:
             data_dir: Optional custom path to the data directory.
                      Defaults to backend/data/cards.
         """
-        if data_dir is None:
-            # Default to backend/data/cards relative to project root
-            project_root = Path(__file__).parent.parent.parent.parent
-            self.data_dir = project_root / "backend" / "data" / "cards"
-        else:
-            self.data_dir = data_dir
+        self.data_dir = DEFAULT_DATA_DIR if data_dir is None else data_dir
 
         self.oracle_cards_path = self.data_dir / self.ORACLE_CARDS_FILENAME
         self.version_path = self.data_dir / self.VERSION_FILENAME
         self.cards: list[CardModel] = []
+        self.cards_by_id: dict[str, CardModel] = {}
+        self.cards_by_name: dict[str, CardModel] = {}
+        self.cards_by_oracle_id: dict[str, list[CardModel]] = {}
+        self._name_index: NameIndex[CardModel] = NameIndex([], lambda card: card.name)
 
     @classmethod
     async def create(cls, data_dir: Path | None = None) -> "CardDatabase":
@@ -79,6 +100,12 @@ class CardDatabase:
 
         This factory method creates a CardDatabase instance and ensures
         the Oracle Cards data is available, downloading it if necessary.
+        Parsing and indexing run in a worker thread so the event loop stays
+        responsive while the cards load.
+
+        Loaded databases are memoized per data directory, so repeated or
+        concurrent calls share one instance instead of parsing the file
+        again.
 
         Args:
             data_dir: Optional custom path to the data directory.
@@ -88,13 +115,46 @@ class CardDatabase:
 
         Raises:
             httpx.HTTPError: If download from Scryfall fails.
-            json.JSONDecodeError: If the downloaded file is not valid JSON.
+            orjson.JSONDecodeError: If the downloaded file is not valid JSON.
         """
         instance = cls(data_dir)
-        await instance._ensure_data()
-        instance._load_cards()
+        async with cls._create_lock:
+            loaded = cls._instances.get(instance.data_dir)
+            if loaded is not None:
+                return loaded
+
+            await instance._ensure_data()
+            await asyncio.to_thread(instance._load_cards)
+            cls._instances[instance.data_dir] = instance
         return instance
 
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Reusing one pooled HTTP/2 client keeps connections to Scryfall alive
+        between the version check and the download instead of opening a new
+        TCP/TLS connection per request.
+
+        Returns:
+            The shared httpx.AsyncClient instance.
+        """
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return cls._client
+
+    @classmethod
+    async def close_client(cls) -> None:
+        """Close the shared HTTP client, if one was created."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
     async def _ensure_data(self) -> None:
         """
         Ensure the Oracle Cards data is up to date.
@@ -163,17 +223,17 @@ class CardDatabase:
             The updated_at timestamp string from Scryfall, or None if unavailable.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.BULK_DATA_ENDPOINT)
-                response.raise_for_status()
-                bulk_data = response.json()
+            client = self._get_client()
+            response = await client.get(self.BULK_DATA_ENDPOINT)
+            response.raise_for_status()
+            bulk_data = response.json()
 
-                # Find the Oracle Cards object
-                for item in bulk_data.get("data", []):
-                    if item.get("type") == self.ORACLE_CARDS_TYPE:
-                        return item.get("updated_at")
+            # Find the Oracle Cards object
+            for item in bulk_data.get("data", []):
+                if item.get("type") == self.ORACLE_CARDS_TYPE:
+                    return item.get("updated_at")
 
-                return None
+            return None
         except Exception as e:
             print(f"Warning: Failed to fetch remote version: {e}")
             return None
@@ -192,82 +252,129 @@ class CardDatabase:
             httpx.HTTPError: If any HTTP request fails.
             ValueError: If Oracle Cards bulk data is not found.
         """
-        async with httpx.AsyncClient() as client:
-            # Step 1: Get the list of bulk data objects
-            print(f"Fetching bulk data list from {self.BULK_DATA_ENDPOINT}...")
-            response = await client.get(self.BULK_DATA_ENDPOINT)
+        client = self._get_client()
+
+        # Step 1: Get the list of bulk data objects
+        print(f"Fetching bulk data list from {self.BULK_DATA_ENDPOINT}...")
+        response = await client.get(self.BULK_DATA_ENDPOINT)
+        response.raise_for_status()
+
+        bulk_data = response.json()
+
+        # Step 2: Find the Oracle Cards object
+        oracle_cards_obj = None
+        for item in bulk_data.get("data", []):
+            if item.get("type") == self.ORACLE_CARDS_TYPE:
+                oracle_cards_obj = item
+                break
+
+        if not oracle_cards_obj:
+            raise ValueError(
+                f"Oracle Cards bulk data not found. "
+                f"Available types: {[item.get('type') for item in bulk_data.get('data', [])]}"
+            )
+
+        download_uri = oracle_cards_obj.get("download_uri")
+        if not download_uri:
+            raise ValueError("Oracle Cards object missing download_uri")
+
+        # Print info about the download
+        size_mb = oracle_cards_obj.get("size", 0) / (1024 * 1024)
+        print(f"Found Oracle Cards dataset:")
+        print(f"  Name: {oracle_cards_obj.get('name')}")
+        print(f"  Description: {oracle_cards_obj.get('description')}")
+        print(f"  Size: {size_mb:.2f} MB")
+        print(f"  Updated: {oracle_cards_obj.get('updated_at')}")
+        print(f"Downloading from {download_uri}...")
+
+        # Step 3: Download the file
+        # Use streaming to handle large files efficiently
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        async with client.stream("GET", download_uri) as response:
             response.raise_for_status()
 
-            bulk_data = response.json()
-
-            # Step 2: Find the Oracle Cards object
-            oracle_cards_obj = None
-            for item in bulk_data.get("data", []):
-                if item.get("type") == self.ORACLE_CARDS_TYPE:
-                    oracle_cards_obj = item
-                    break
-
-            if not oracle_cards_obj:
-                raise ValueError(
-                    f"Oracle Cards bulk data not found. "
-                    f"Available types: {[item.get('type') for item in bulk_data.get('data', [])]}"
-                )
-
-            download_uri = oracle_cards_obj.get("download_uri")
-            if not download_uri:
-                raise ValueError("Oracle Cards object missing download_uri")
-
-            # Print info about the download
-            size_mb = oracle_cards_obj.get("size", 0) / (1024 * 1024)
-            print(f"Found Oracle Cards dataset:")
-            print(f"  Name: {oracle_cards_obj.get('name')}")
-            print(f"  Description: {oracle_cards_obj.get('description')}")
-            print(f"  Size: {size_mb:.2f} MB")
-            print(f"  Updated: {oracle_cards_obj.get('updated_at')}")
-            print(f"Downloading from {download_uri}...")
-
-            # Step 3: Download the file
-            # Use streaming to handle large files efficiently
-            self.data_dir.mkdir(parents=True, exist_ok=True)
-
-            async with client.stream("GET", download_uri) as response:
-                response.raise_for_status()
-
-                with self.oracle_cards_path.open("wb") as f:
-                    total_downloaded = 0
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                        total_downloaded += len(chunk)
-                        # Print progress every 10 MB
-                        if total_downloaded % (10 * 1024 * 1024) < 8192:
-                            downloaded_mb = total_downloaded / (1024 * 1024)
-                            print(f"  Downloaded {downloaded_mb:.2f} MB...")
-
-            print(f"Successfully downloaded Oracle Cards to {self.oracle_cards_path}")
-
-            # Save the version information
-            updated_at = oracle_cards_obj.get("updated_at")
-            if updated_at:
-                self._write_local_version(updated_at)
-                print(f"Saved version information: {updated_at}")
+            with self.oracle_cards_path.open("wb") as f:
+                total_downloaded = 0
+                next_report = self.PROGRESS_INTERVAL
+                async for chunk in response.aiter_bytes(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    total_downloaded += len(chunk)
+                    # Print progress every 10 MB
+                    if total_downloaded >= next_report:
+                        downloaded_mb = total_downloaded / (1024 * 1024)
+                        print(f"  Downloaded {downloaded_mb:.2f} MB...")
+                        next_report += self.PROGRESS_INTERVAL
+
+        print(f"Successfully downloaded Oracle Cards to {self.oracle_cards_path}")
+
+        # Save the version information
+        updated_at = oracle_cards_obj.get("updated_at")
+        if updated_at:
+            self._write_local_version(updated_at)
+            print(f"Saved version information: {updated_at}")
 
     def _load_cards(self) -> None:
         """
         Load cards from the oracle-cards.json file into memory.
 
+        The file is memory-mapped and parsed with orjson straight from the
+        mapped pages, so the raw JSON text is never copied into a Python
+        string before parsing. Cards are then validated one at a time in
+        place, which keeps peak memory close to a single copy of the data.
+
+        Fields that CardModel does not declare are dropped by validation, and
+        low-cardinality string values are interned first so that the many
+        cards sharing a set, rarity or type line share a single str object.
+        Identical legalities dicts are shared between the cards of one load.
+
         Raises:
-            json.JSONDecodeError: If the file is not valid JSON.
+            orjson.JSONDecodeError: If the file is not valid JSON (including an empty file).
             FileNotFoundError: If the oracle-cards.json file doesn't exist.
         """
         print(f"Loading cards from {self.oracle_cards_path}...")
-        with self.oracle_cards_path.open("r", encoding="utf-8") as f:
-            card_data = json.load(f)
+        card_data = read_json_file(self.oracle_cards_path)
 
         print(f"Validating {len(card_data)} cards with CardModel...")
-        adapter = TypeAdapter(list[CardModel])
-        self.cards = adapter.validate_python(card_data)
+        # Canonical legalities dicts for this load only, filled by validation
+        context = {"legalities": {}}
+
+        def build_card(raw_card: dict[str, Any]) -> CardModel:
+            intern_repeated_values(raw_card, self._INTERNED_KEYS, self._INTERNED_LIST_KEYS)
+            return CARD_ADAPTER.validate_python(raw_card, context=context)
+
+        self.cards = build_in_place(card_data, build_card)
         print(f"Loaded {len(self.cards)} cards")
 
+        self._build_indices()
+
+    def _build_indices(self) -> None:
+        """Build lookup indices over the loaded cards."""
+        self.cards_by_id = {card.id: card for card in self.cards}
+
+        # First card wins for duplicate names, matching a front-to-back scan
+        self.cards_by_name = {}
+        self.cards_by_oracle_id = {}
+        for card in self.cards:
+            self.cards_by_name.setdefault(card.name, card)
+            if card.oracle_id:
+                self.cards_by_oracle_id.setdefault(card.oracle_id, []).append(card)
+
+        # Name search index: prefix matches first, then substring matches
+        self._name_index = NameIndex(self.cards, lambda card: card.name)
+
+    def get_card_by_id(self, card_id: str) -> CardModel | None:
+        """
+        Get a card by its Scryfall ID.
+
+        Args:
+            card_id: The Scryfall card ID to look up.
+
+        Returns:
+            CardModel instance if found, None otherwise.
+        """
+        return self.cards_by_id.get(card_id)
+
     def get_card_by_name(self, name: str) -> CardModel | None:
         """
         Get a card by its exact name.
@@ -278,10 +385,7 @@ class CardDatabase:
         Returns:
             CardModel instance if found, None otherwise.
         """
-        for card in self.cards:
-            if card.name == name:
-                return card
-        return None
+        return self.cards_by_name.get(name)
 
     def get_cards_by_oracle_id(self, oracle_id: str) -> list[CardModel]:
         """
@@ -293,12 +397,16 @@ class CardDatabase:
         Returns:
             List of CardModel instances with the matching Oracle ID.
         """
-        return [card for card in self.cards if card.oracle_id == oracle_id]
+        return list(self.cards_by_oracle_id.get(oracle_id, []))
 
     def search_cards(self, query: str, limit: int = 10) -> list[CardModel]:
         """
         Simple card name search.
 
+        Cards whose name starts with the query are returned first, in name
+        order. Remaining slots are filled with cards that contain the query
+        elsewhere in their name, in load order.
+
         Args:
             query: Search string to match against card names (case-insensitive).
             limit: Maximum number of results to return.
@@ -306,13 +414,4 @@ class CardDatabase:
         Returns:
             List of matching CardModel instances.
         """
-        query_lower = query.lower()
-        results = []
-
-        for card in self.cards:
-            if query_lower in card.name.lower():
-                results.append(card)
-                if len(results) >= limit:
-                    break
-
-        return results
+        return self._name_index.search(query, limit)
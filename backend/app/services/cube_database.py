@@ -6,24 +6,67 @@ or downloads from S3 if needed, and provides fast lookups by cube ID.
 """
 
 import os
-import json
+import pickle
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 import boto3
+import orjson
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from dotenv import load_dotenv
-from pydantic import TypeAdapter
 
-from app.models.cube import CubeModel
+from app.models.cube import CUBE_ADAPTER, CubeModel, construct_cube
+from app.services.name_index import NameIndex
+from app.services.raw_data import build_in_place, intern_repeated_values, read_json_file
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
 LOCAL_DATA_PATH = Path('data/cube/cube_data_dump.json')
-LOCAL_FILTERED_DATA_PATH = Path('data/cube/cube_data_dump_filtered.json')
+LOCAL_FILTERED_DATA_PATH = Path('data/cube/cube_data_dump_filtered.jsonl')
+LOCAL_ETAG_PATH = Path('data/cube/cube_data_dump.etag')
 DATA_DIR = Path('data/cube')
 
+# Cubes built from the dump, pickled so warm starts skip JSON parsing
+CUBE_CACHE_PATH = Path('data/cube/cube_index.pickle')
+
+# Bump when the way cubes are built changes (conversions, interning, field
+# validators) without CubeModel's field names or types changing
+CUBE_CACHE_VERSION = 1
+
+# Multipart settings for downloading the ~330MB dump in parallel parts
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=32 * 1024 * 1024,
+    max_concurrency=32,
+    use_threads=True,
+)
+
+# The S3 dump is trusted, so it is only fully validated when this is set
+VALIDATE_CUBE_DATA = os.getenv('CUBE_VALIDATE') == '1'
+
+
+@lru_cache(maxsize=1)
+def _get_s3_client(aws_access_key: str, aws_secret_key: str, aws_region: str):
+    """
+    Get an S3 client for the given credentials, creating it on first use.
+
+    Building a boto3 client loads the botocore service model and sets up a
+    connection pool, so one client is shared by the freshness check and the
+    download instead of creating one for each.
+    """
+    return boto3.client(
+        's3',
+        aws_access_key_id=aws_access_key,
+        aws_secret_access_key=aws_secret_key,
+        region_name=aws_region,
+        # One pooled connection per concurrent multipart download thread
+        config=Config(max_pool_connections=S3_TRANSFER_CONFIG.max_request_concurrency, tcp_keepalive=True),
+    )
+
 
 class CubeDatabase:
     """
@@ -36,9 +79,8 @@ class CubeDatabase:
     updates if the S3 file is newer than the local cache.
 
     Attributes:
-        cube_data: The full cube dataset loaded from local storage/S3
+        cube_data: All indexed cubes (derived from cube_index)
         cube_index: Dictionary mapping cube IDs to their data for fast lookup
-        use_filtered: Whether to use filtered data (default: True)
 
     Example:
         ```python
@@ -49,42 +91,60 @@ class CubeDatabase:
         cube_data = db.get_cube("1fdv1")
 
         # Access cube information
-        print(cube_data["name"])
-        print(cube_data.get("card_count"))
+        print(cube_data.name)
+        print(cube_data.card_count)
         ```
     """
 
-    def __init__(self, use_filtered: bool = True):
+    # Owners, categories and tags are shared by many cubes, so they are
+    # interned at load and every cube references one copy of each value
+    _INTERNED_KEYS = ("owner", "categoryOverride")
+    _INTERNED_LIST_KEYS = ("tags", "categoryPrefixes")
+
+    def __init__(self):
         """
         Initialize the CubeDatabase.
 
-        Loads the cube data from local cache or S3, checking for updates.
-
-        Args:
-            use_filtered: If True, use filtered data (removes clones and low-follower cubes)
+        Loads the full cube data from local cache or S3, checking for updates.
         """
-        self.use_filtered = use_filtered
+        # HeadObject response from the staleness check, so a download that
+        # follows it needs no extra HeadObject call
+        self._remote_head: dict[str, Any] | None = None
         print("Loading cube data from local storage/S3...")
-        self.cube_data: list[CubeModel] = self._load_cube_data()
 
-        # Build index for fast lookups
-        print("Building cube index...")
-        self.cube_index: dict[str, CubeModel] = {}
+        # Build the index straight from the loaded cubes; the index is the
+        # only structure lookups use, so the loaded list is not kept
+        self.cube_index: dict[str, CubeModel] = {
+            cube.id: cube for cube in self._load_cube_data() if cube.id
+        }
+
+        # Derived views of the index. The index is only populated here, so
+        # they never need invalidating; they are built once below so the
+        # first request doesn't pay for them.
+        self._ids_cache: list[str] | None = None
+        self._summaries_cache: list[dict[str, str]] | None = None
+        self._summaries_json: bytes | None = None
 
-        for cube in self.cube_data:
-            cube_id = cube.id
-            if cube_id:
-                self.cube_index[cube_id] = cube
+        # Name search index: prefix matches first, then substring matches
+        self._name_index = NameIndex(list(self.cube_index.values()), lambda cube: cube.name)
+
+        self.get_all_cube_ids()
+        self.get_all_cube_summaries_json()
 
         print(f"CubeDatabase ready with {len(self.cube_index)} cubes")
 
+    @property
+    def cube_data(self) -> list[CubeModel]:
+        """All indexed cubes, in load order."""
+        return list(self.cube_index.values())
+
     def _load_cube_data(self) -> list[CubeModel]:
         """
         Load cube data from local file or download from S3 if not present.
         Checks if S3 file is newer and re-downloads if needed.
 
         Returns:
-            list: The cube data (filtered or full) loaded from JSON
+            list: The full cube data loaded from JSON
         """
         # Check if we need to update from S3
         needs_s3_update = False
@@ -96,44 +156,118 @@ class CubeDatabase:
             print("S3 file is newer than local file. Downloading updated version...")
             needs_s3_update = True
 
-        # Download from S3 if needed (this updates both full and filtered dumps)
+        # Download from S3 if needed (this updates both full and filtered dumps).
+        # The download already parses the new dump, so that data is used
+        # directly instead of reading the file back.
         if needs_s3_update:
             print("Attempting to download from S3...")
-            self._download_and_process_from_s3()
+            cube_data = self._download_and_process_from_s3()
+        else:
+            # Reuse the cubes built on a previous start if the dump hasn't changed
+            if not VALIDATE_CUBE_DATA:
+                cached_cubes = self._load_cube_cache()
+                if cached_cubes is not None:
+                    return cached_cubes
+
+            print("Loading full unfiltered data...")
+            cube_data = self._load_full_data()
+
+        construct = CUBE_ADAPTER.validate_python if VALIDATE_CUBE_DATA else construct_cube
+
+        def build_cube(row: dict[str, Any]) -> CubeModel:
+            intern_repeated_values(row, self._INTERNED_KEYS, self._INTERNED_LIST_KEYS)
+            return construct(row)
+
+        build_in_place(cube_data, build_cube)
 
-        print("Loading full unfiltered data...")
-        cube_data = self._load_full_data()
+        self._save_cube_cache(cube_data)
+        return cube_data
 
-        adapter = TypeAdapter(list[CubeModel])
-        return adapter.validate_python(cube_data)
-        return adapter.model_construct(cube_data)
+    @staticmethod
+    def _cube_cache_key(source: Path) -> tuple[int, tuple[tuple[str, str], ...], int]:
+        """
+        Key identifying what a cube cache was built from.
+
+        Args:
+            source: The cube dump the cubes are built from
+
+        Returns:
+            tuple: The cache version, CubeModel's field names and annotations,
+            and the dump's modification time in nanoseconds
+        """
+        fields = tuple(
+            (name, repr(field.annotation)) for name, field in CubeModel.model_fields.items()
+        )
+        return CUBE_CACHE_VERSION, fields, source.stat().st_mtime_ns
+
+    def _load_cube_cache(self) -> list[CubeModel] | None:
+        """
+        Load the cubes built on a previous start from the pickle cache.
 
-        return [CubeModel.model_construct(row) for row in cube_data]
-        # return [CubeModel.model_validate(row) for row in cube_data[:100]]
+        Returns:
+            list: The cached cubes, or None if the cache is missing or was built
+            from a different cube dump, cache version or CubeModel layout
+        """
+        if not CUBE_CACHE_PATH.exists():
+            return None
+
+        try:
+            with open(CUBE_CACHE_PATH, 'rb') as f:
+                # The key is pickled separately ahead of the cubes, so a stale
+                # cache is rejected without unpickling all of them
+                if pickle.load(f) != self._cube_cache_key(LOCAL_DATA_PATH):
+                    print("Cube cache was built from a different cube dump or CubeModel, rebuilding...")
+                    return None
+                cube_data = pickle.load(f)
+        except Exception as e:
+            print(f"Warning: Could not read cube cache: {e}")
+            return None
+
+        print(f"Loaded {len(cube_data)} cubes from cache {CUBE_CACHE_PATH}")
+        return cube_data
+
+    def _save_cube_cache(self, cube_data: list[CubeModel]) -> None:
+        """Save the built cubes to the pickle cache for the next start."""
+        tmp_path = CUBE_CACHE_PATH.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self._cube_cache_key(LOCAL_DATA_PATH), f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(cube_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, CUBE_CACHE_PATH)
+            print(f"Saved cube cache to {CUBE_CACHE_PATH}")
+        except OSError as e:
+            print(f"Warning: Could not write cube cache: {e}")
 
     def _load_full_data(self) -> list[dict[str, Any]]:
         """Load the full unfiltered cube data from local file."""
         print(f"Loading full data from {LOCAL_DATA_PATH}")
-        with open(LOCAL_DATA_PATH, 'r') as f:
-            data = json.load(f)
+        data = read_json_file(LOCAL_DATA_PATH)
         print(f"Successfully loaded {len(data)} cubes (unfiltered)")
         return data
 
-    def _load_filtered_data(self) -> list[dict[str, Any]]:
-        """Load the filtered cube data from local file."""
-        with open(LOCAL_FILTERED_DATA_PATH, 'r') as f:
-            data = json.load(f)
-        print(f"Successfully loaded {len(data)} cubes (filtered)")
-        return data
+    def _save_filtered_data(self, filtered_data: Iterable[dict[str, Any]]) -> int:
+        """
+        Save filtered cube data to local file as JSON lines.
 
-    def _save_filtered_data(self, filtered_data: list[dict[str, Any]]) -> None:
-        """Save filtered cube data to local file."""
-        print(f"Saving filtered data to {LOCAL_FILTERED_DATA_PATH}")
-        with open(LOCAL_FILTERED_DATA_PATH, 'w') as f:
-            json.dump(filtered_data, f)
-        print(f"Saved {len(filtered_data)} filtered cubes")
+        Cubes are encoded and written one at a time, so neither a filtered
+        list nor a single encoded document of all of them is ever built.
 
-    def _filter_cubes(self, cube_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        Args:
+            filtered_data: Cubes to save
+
+        Returns:
+            int: Number of cubes saved
+        """
+        print(f"Saving filtered data to {LOCAL_FILTERED_DATA_PATH}")
+        count = 0
+        with open(LOCAL_FILTERED_DATA_PATH, 'wb') as f:
+            for cube in filtered_data:
+                f.write(orjson.dumps(cube, option=orjson.OPT_APPEND_NEWLINE))
+                count += 1
+        print(f"Saved {count} filtered cubes")
+        return count
+
+    def _filter_cubes(self, cube_data: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
         """
         Filter cube data to remove unwanted cubes.
 
@@ -145,23 +279,16 @@ class CubeDatabase:
             cube_data: List of cube dictionaries
 
         Returns:
-            list: Filtered cube data
+            Iterator over the cubes that pass the filter
         """
-        if not isinstance(cube_data, list):
-            return cube_data
-
-        original_count = len(cube_data)
-
-        filtered_data = [
-            cube for cube in cube_data
-            if not cube.get('name', '').startswith('Clone')
-            and len(cube.get('following', [])) >= 2
-        ]
-
-        filtered_count = original_count - len(filtered_data)
-        print(f"Filtered out {filtered_count} cubes ({len(filtered_data)} remaining)")
-
-        return filtered_data
+        get = dict.get
+        for cube in cube_data:
+            # Most cubes fail the follower check, so it runs first and the name
+            # is only looked at for the rest. Slice compare and `or ()` avoid a
+            # method call and an empty list allocation per cube; both also
+            # tolerate null fields
+            if len(get(cube, 'following') or ()) >= 2 and (get(cube, 'name') or '')[:5] != 'Clone':
+                yield cube
 
     def _get_s3_credentials(self) -> tuple[str, str, str, str, str]:
         """
@@ -188,6 +315,34 @@ class CubeDatabase:
 
         return aws_access_key, aws_secret_key, aws_region, bucket_name, s3_key
 
+    def _read_local_etag(self) -> str | None:
+        """
+        Read the ETag of the downloaded S3 object from its sidecar file.
+
+        Returns:
+            The ETag string, or None if it was never recorded.
+        """
+        if not LOCAL_ETAG_PATH.exists():
+            return None
+
+        try:
+            return LOCAL_ETAG_PATH.read_text().strip() or None
+        except OSError as e:
+            print(f"Warning: Failed to read ETag file: {e}")
+            return None
+
+    def _write_local_etag(self, etag: str) -> None:
+        """
+        Record the ETag of the downloaded S3 object in its sidecar file.
+
+        Args:
+            etag: The ETag returned by S3 for the downloaded object.
+        """
+        try:
+            LOCAL_ETAG_PATH.write_text(etag)
+        except OSError as e:
+            print(f"Warning: Failed to write ETag file: {e}")
+
     def _is_s3_file_newer(self) -> bool:
         """
         Check if the S3 file is newer than the local file.
@@ -199,16 +354,26 @@ class CubeDatabase:
             # Get credentials
             aws_access_key, aws_secret_key, aws_region, bucket_name, s3_key = self._get_s3_credentials()
 
-            # Create S3 client
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=aws_access_key,
-                aws_secret_access_key=aws_secret_key,
-                region_name=aws_region
-            )
+            s3_client = _get_s3_client(aws_access_key, aws_secret_key, aws_region)
+
+            # Prefer the ETag recorded at download time: it only changes when
+            # the object's content does, unlike local file timestamps
+            local_etag = self._read_local_etag()
+            if local_etag is not None:
+                try:
+                    response = s3_client.head_object(Bucket=bucket_name, Key=s3_key, IfNoneMatch=local_etag)
+                except ClientError as e:
+                    if e.response['Error']['Code'] == '304':
+                        print(f"S3 file unchanged (ETag {local_etag})")
+                        return False
+                    raise
+                self._remote_head = response
+                print(f"S3 file ETag differs from local ETag {local_etag}")
+                return True
 
             # Get S3 object metadata
             response = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+            self._remote_head = response
             s3_last_modified = response['LastModified']
 
             # Get local file modification time
@@ -218,7 +383,7 @@ class CubeDatabase:
             # Convert to comparable format (timestamps)
             s3_timestamp = s3_last_modified.timestamp()
 
-            print(f"Local file last modified: {os.path.getctime(LOCAL_DATA_PATH)}")
+            print(f"Local file last modified: {local_last_modified}")
             print(f"S3 file last modified: {s3_last_modified}")
 
             # Return True if S3 is newer
@@ -233,12 +398,15 @@ class CubeDatabase:
             print("Assuming local file is current...")
             return False
 
-    def _download_and_process_from_s3(self) -> None:
+    def _download_and_process_from_s3(self) -> list[dict[str, Any]]:
         """
         Download cube data from AWS S3 and create both full and filtered versions.
 
         This function downloads the full dataset from S3, saves it locally,
         and also creates and saves a filtered version.
+
+        Returns:
+            list: The full cube data parsed from the downloaded file
         """
         # Get AWS credentials
         aws_access_key, aws_secret_key, aws_region, bucket_name, s3_key = self._get_s3_credentials()
@@ -246,32 +414,52 @@ class CubeDatabase:
         print(f"Downloading from S3: s3://{bucket_name}/{s3_key}")
 
         try:
-            # Create S3 client
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=aws_access_key,
-                aws_secret_access_key=aws_secret_key,
-                region_name=aws_region
-            )
+            s3_client = _get_s3_client(aws_access_key, aws_secret_key, aws_region)
 
             # Create data directory if it doesn't exist
             DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+            # Use the object metadata from the staleness check when there was
+            # one, and only ask S3 for it when there is no local dump to check
+            head = self._remote_head
+            if head is None:
+                head = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+            etag = head['ETag']
+
+            # On a versioned bucket, pin every ranged part to the version that
+            # was checked so parts of two versions are never mixed. Otherwise a
+            # mid-download replacement leaves a stale ETag behind, which just
+            # triggers another download on the next start.
+            extra_args = {'VersionId': head['VersionId']} if head.get('VersionId') else None
+
             # Download file
             print("Downloading... (this may take a while for a 330MB file)")
-            s3_client.download_file(bucket_name, s3_key, str(LOCAL_DATA_PATH))
+            # Download to a fresh temporary file and move it into place, so an
+            # interrupted download never leaves a truncated dump behind
+            tmp_path = LOCAL_DATA_PATH.with_suffix('.json.part')
+            tmp_path.unlink(missing_ok=True)
+            s3_client.download_file(
+                bucket_name,
+                s3_key,
+                str(tmp_path),
+                ExtraArgs=extra_args,
+                Config=S3_TRANSFER_CONFIG,
+            )
+            os.replace(tmp_path, LOCAL_DATA_PATH)
             print(f"Successfully downloaded to: {LOCAL_DATA_PATH}")
+            self._write_local_etag(etag)
 
             # Load the data
-            with open(LOCAL_DATA_PATH, 'r') as f:
-                full_data = json.load(f)
+            full_data = read_json_file(LOCAL_DATA_PATH)
 
             print(f"Successfully loaded {len(full_data)} cubes from S3")
 
             # Create and save filtered version
             print("Creating filtered version...")
-            filtered_data = self._filter_cubes(full_data)
-            self._save_filtered_data(filtered_data)
+            filtered_count = self._save_filtered_data(self._filter_cubes(full_data))
+            print(f"Filtered out {len(full_data) - filtered_count} cubes ({filtered_count} remaining)")
+
+            return full_data
 
         except NoCredentialsError:
             raise ValueError("AWS credentials not found or invalid")
@@ -284,7 +472,7 @@ class CubeDatabase:
         except Exception as e:
             raise ValueError(f"Error downloading from S3: {e}")
 
-    def get_cube(self, cube_id: str) -> dict[str, Any] | None:
+    def get_cube(self, cube_id: str) -> CubeModel | None:
         """
         Get a cube by its CubeCobra ID.
 
@@ -292,7 +480,7 @@ class CubeDatabase:
             cube_id: The CubeCobra cube ID (e.g., "1fdv1")
 
         Returns:
-            Dictionary containing the cube data, or None if not found.
+            CubeModel for the cube, or None if not found.
         """
         return self.cube_index.get(cube_id)
 
@@ -303,7 +491,9 @@ class CubeDatabase:
         Returns:
             List of all cube IDs
         """
-        return list(self.cube_index.keys())
+        if self._ids_cache is None:
+            self._ids_cache = list(self.cube_index.keys())
+        return self._ids_cache
 
     def get_all_cube_summaries(self) -> list[dict[str, str]]:
         """
@@ -312,18 +502,35 @@ class CubeDatabase:
         Returns:
             List of dictionaries containing cube shortId and name
         """
-        summaries = []
-        for cube_id, cube_data in self.cube_index.items():
-            summaries.append({
-                "shortId": cube_id,
-                "name": cube_data.name
-            })
-        return summaries
+        if self._summaries_cache is None:
+            self._summaries_cache = [
+                {"shortId": cube_id, "name": cube_data.name}
+                for cube_id, cube_data in self.cube_index.items()
+            ]
+        return self._summaries_cache
+
+    def get_all_cube_summaries_json(self) -> bytes:
+        """
+        Get the cube summaries pre-encoded as a JSON array.
+
+        The payload is encoded once and reused, so listing endpoints can
+        return it without serializing thousands of summaries per request.
 
-    def search_cubes(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        Returns:
+            JSON bytes of the list returned by get_all_cube_summaries()
+        """
+        if self._summaries_json is None:
+            self._summaries_json = orjson.dumps(self.get_all_cube_summaries())
+        return self._summaries_json
+
+    def search_cubes(self, query: str, limit: int = 10) -> list[CubeModel]:
         """
         Search for cubes by name.
 
+        Cubes whose name starts with the query are returned first, in name
+        order. Remaining slots are filled with cubes that contain the query
+        elsewhere in their name, in index order.
+
         Args:
             query: Search query string
             limit: Maximum number of results to return
@@ -331,17 +538,7 @@ class CubeDatabase:
         Returns:
             List of cubes matching the query
         """
-        query_lower = query.lower()
-        results = []
-
-        for cube in self.cube_index.values():
-            name = cube.get('name', '')
-            if query_lower in name.lower():
-                results.append(cube)
-                if len(results) >= limit:
-                    break
-
-        return results
+        return self._name_index.search(query, limit)
 
     def get_cube_count(self) -> int:
         """
@@ -0,0 +1,100 @@
+"""
+Case-insensitive name search index shared by the card and cube databases.
+
+This module provides a NameIndex class that searches a fixed list of items
+by name, returning prefix matches first and then substring matches.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class NameIndex(Generic[T]):
+    """
+    Name search over a fixed list of items.
+
+    Names are lowercased once when the index is built. Prefix matches are
+    found by binary search over the names in sorted order. Substring matches
+    are found by scanning all names joined into one newline-separated string
+    with str.find, which runs over contiguous text instead of a Python loop
+    over every name.
+
+    Example:
+        ```python
+        index = NameIndex(cards, lambda card: card.name)
+        index.search("bolt", limit=5)
+        ```
+    """
+
+    def __init__(self, items: list[T], get_name: Callable[[T], str]):
+        """
+        Build the index.
+
+        Args:
+            items: Items to search, in the order unranked results are returned
+            get_name: Returns the name of an item
+        """
+        self._items = items
+        names_lower = [get_name(item).lower() for item in items]
+
+        # Offset where each name starts in the joined string, plus an end sentinel
+        self._names_blob = "\n".join(names_lower)
+        self._name_offsets: list[int] = []
+        offset = 0
+        for name in names_lower:
+            self._name_offsets.append(offset)
+            offset += len(name) + 1
+        self._name_offsets.append(offset)
+
+        order = sorted(range(len(items)), key=names_lower.__getitem__)
+        self._sorted_names = [names_lower[i] for i in order]
+        self._sorted_items = [items[i] for i in order]
+
+    def search(self, query: str, limit: int = 10) -> list[T]:
+        """
+        Search items by name (case-insensitive).
+
+        Items whose name starts with the query come first, in name order.
+        Remaining slots are filled with items that contain the query elsewhere
+        in their name, in index order. An empty query returns the first items.
+
+        Args:
+            query: Search string to match against names
+            limit: Maximum number of results to return
+
+        Returns:
+            List of matching items
+        """
+        query_lower = query.lower()
+        if not query_lower:
+            return self._items[:limit]
+
+        results = []
+        start = bisect_left(self._sorted_names, query_lower)
+        for name, item in zip(self._sorted_names[start:start + limit], self._sorted_items[start:start + limit]):
+            if not name.startswith(query_lower):
+                break
+            results.append(item)
+
+        if len(results) >= limit:
+            return results
+
+        # The separator is a newline, so such a query could span two names
+        if "\n" in query_lower:
+            return results
+
+        blob = self._names_blob
+        offsets = self._name_offsets
+        pos = blob.find(query_lower)
+        while pos != -1:
+            i = bisect_right(offsets, pos) - 1
+            # A hit at the start of a name is a prefix match, already returned
+            if pos != offsets[i]:
+                results.append(self._items[i])
+                if len(results) >= limit:
+                    break
+            pos = blob.find(query_lower, offsets[i + 1])
+
+        return results
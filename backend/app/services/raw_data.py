@@ -0,0 +1,85 @@
+"""
+Helpers for loading large JSON dumps into models, shared by the card and
+cube databases.
+"""
+
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Iterable, TypeVar
+
+import orjson
+
+T = TypeVar("T")
+
+
+def read_json_file(path: Path) -> Any:
+    """
+    Parse a JSON file with orjson.
+
+    The file is memory-mapped and parsed straight from the mapped pages, so
+    the raw JSON text is never copied into a bytes or str object first. An
+    empty file cannot be mapped, so it is read instead.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        The parsed JSON value
+
+    Raises:
+        orjson.JSONDecodeError: If the file is not valid JSON (including an empty file).
+        FileNotFoundError: If the file doesn't exist.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def intern_repeated_values(row: dict[str, Any], keys: Iterable[str], list_keys: Iterable[str]) -> None:
+    """
+    Intern string values that repeat across many records, in place.
+
+    Validation keeps the str objects it is given, so interning the raw values
+    means the loaded models reference one shared copy of each value.
+
+    Args:
+        row: Raw record parsed from a dump
+        keys: Keys whose string values are interned
+        list_keys: Keys whose lists of strings are interned item by item
+    """
+    for key in keys:
+        value = row.get(key)
+        if isinstance(value, str):
+            row[key] = sys.intern(value)
+
+    for key in list_keys:
+        values = row.get(key)
+        if isinstance(values, list):
+            row[key] = [
+                sys.intern(v) if isinstance(v, str) else v for v in values
+            ]
+
+
+def build_in_place(rows: list[Any], build: Callable[[Any], T]) -> list[T]:
+    """
+    Replace each raw record in a list with the model built from it.
+
+    Working in place lets every raw dict be freed as soon as its model is
+    built, instead of the whole raw list and the whole model list being alive
+    at the same time.
+
+    Args:
+        rows: Raw records, replaced in place
+        build: Builds the model for one raw record
+
+    Returns:
+        The same list, now holding the built models
+    """
+    for i, row in enumerate(rows):
+        rows[i] = build(row)
+    return rows
@@ -103,8 +103,9 @@ class Recommender(ABC):
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
+        # Use the newest pickle protocol
         with open(filepath, 'wb') as f:
-            pickle.dump(self, f)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
     def load(cls, filepath: Path | str) -> "Recommender":
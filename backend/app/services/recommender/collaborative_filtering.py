@@ -6,13 +6,16 @@ based on cube-cube similarity. It finds cubes similar to the target cube and
 recommends cards that appear in those similar cubes.
 """
 
-from typing import Any, Dict, List, Optional, Set
-from collections import defaultdict
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+from collections import OrderedDict, defaultdict
+from functools import cached_property
+from scipy.sparse import csr_matrix
 import numpy as np
 
 from app.models.cube import CubeModel
 from app.models.recommender import CubeBasedCollaborativeFilteringConfig
 from app.services.recommender.base import Recommender
+from app.services.recommender.utils import generate_sparse_cf_matrix
 
 
 class CubeBasedCollaborativeFilteringRecommender(Recommender):
@@ -21,7 +24,9 @@ class CubeBasedCollaborativeFilteringRecommender(Recommender):
 
     This recommender finds cubes similar to a target cube based on their shared
     cards, then recommends cards that appear in similar cubes but not in the
-    target cube. Similarity is calculated using Jaccard similarity coefficient.
+    target cube. Similarity is calculated using Jaccard similarity coefficient,
+    evaluated against every training cube at once with a sparse matrix-vector
+    product over the cube-card matrix built at fit time.
 
     The recommendation score for each card is based on:
     - How frequently it appears in similar cubes
@@ -34,6 +39,13 @@ class CubeBasedCollaborativeFilteringRecommender(Recommender):
     - similarity_metric: Method for calculating similarity (currently only Jaccard)
     """
 
+    # Number of targets whose similar-cube lists are kept between recommend() calls
+    SIMILAR_CUBES_CACHE_SIZE = 1024
+
+    # Set-based views of the cube-card matrix, built on first access and
+    # left out of pickles since they can be rebuilt from the matrix
+    _DERIVED_INDICES = ('cube_cards', 'card_cubes', 'all_card_ids')
+
     def __init__(self, config: Optional[CubeBasedCollaborativeFilteringConfig] = None) -> None:
         """
         Initialize the cube-based collaborative filtering recommender.
@@ -43,57 +55,82 @@ class CubeBasedCollaborativeFilteringRecommender(Recommender):
         """
         super().__init__()
         self.config = config or CubeBasedCollaborativeFilteringConfig()
-        self.cube_cards: Dict[str, Set[str]] = {}
-        self.card_cubes: Dict[str, Set[str]] = defaultdict(set)
-        self.card_names: Dict[str, str] = {}
-        self.all_card_ids: Set[str] = set()
 
-    def _extract_card_ids(self, cube: CubeModel) -> Set[str]:
+        # Sparse cube-card matrix and its index mappings, built in fit()
+        self.cube_card_matrix: Optional[csr_matrix] = None
+        self.card_to_col: Dict[int, int] = {}
+        self.cube_to_row: Dict[str, int] = {}
+        self.row_cube_ids: List[str] = []
+        self.cube_sizes: np.ndarray = np.zeros(0, dtype=np.int32)
+        self.col_card_ids: np.ndarray = np.zeros(0, dtype=np.int64)
+
+        # LRU of _find_similar_cubes results, keyed by target and parameters
+        self._similar_cubes_cache: OrderedDict[tuple, List[tuple[str, float]]] = OrderedDict()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle only the fitted arrays and mappings; the set-based indices
+        # and the similar-cube cache are rebuilt on demand after loading
+        state = self.__dict__.copy()
+        for name in self._DERIVED_INDICES:
+            state.pop(name, None)
+        state['_similar_cubes_cache'] = OrderedDict()
+        return state
+
+    @cached_property
+    def cube_cards(self) -> Dict[str, FrozenSet[int]]:
+        """Card IDs of each training cube, keyed by cube ID."""
+        if self.cube_card_matrix is None:
+            return {}
+        indptr = self.cube_card_matrix.indptr.tolist()
+        card_ids = self.col_card_ids[self.cube_card_matrix.indices].tolist()
+        return {
+            cube_id: frozenset(card_ids[indptr[row]:indptr[row + 1]])
+            for row, cube_id in enumerate(self.row_cube_ids)
+        }
+
+    @cached_property
+    def card_cubes(self) -> Dict[int, Set[str]]:
+        """Reverse index: IDs of the training cubes containing each card."""
+        if self.cube_card_matrix is None:
+            return defaultdict(set)
+        # One matrix column per card
+        card_cube_matrix = self.cube_card_matrix.tocsc()
+        indptr = card_cube_matrix.indptr.tolist()
+        rows = card_cube_matrix.indices.tolist()
+        row_cube_ids = self.row_cube_ids
+        return defaultdict(set, {
+            card_id: {row_cube_ids[row] for row in rows[indptr[col]:indptr[col + 1]]}
+            for card_id, col in self.card_to_col.items()
+        })
+
+    @cached_property
+    def all_card_ids(self) -> Set[int]:
+        """Every card ID seen in the training cubes."""
+        return set(self.card_to_col)
+
+    def _extract_card_ids(self, cube: CubeModel) -> FrozenSet[int]:
         """
         Extract unique card IDs from a cube.
 
-        Args:
-            cube: CubeModel to extract cards from
-
-        Returns:
-            Set of card IDs (oracle_id or name as fallback)
-        """
-        card_ids = set()
-        for card in cube.cards:
-            # Use oracle_id if available, otherwise fall back to name
-            card_id = card.get('oracle_id') or card.get('name')
-            if card_id:
-                card_ids.add(card_id)
-                # Store card name for recommendations
-                if 'name' in card:
-                    self.card_names[card_id] = card['name']
-        return card_ids
-
-    def _calculate_jaccard_similarity(self, set1: Set[str], set2: Set[str]) -> float:
-        """
-        Calculate Jaccard similarity between two sets.
+        The set is frozen so the target's card set can be reused as-is in
+        the similar-cube cache key.
 
         Args:
-            set1: First set
-            set2: Second set
+            cube: CubeModel to extract cards from
 
         Returns:
-            Jaccard similarity coefficient (0.0 to 1.0)
+            Frozen set of card IDs in the cube
         """
-        if not set1 or not set2:
-            return 0.0
-
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-
-        return intersection / union if union > 0 else 0.0
+        return frozenset(cube.card_ids.tolist())
 
     def fit(self, cubes: List[CubeModel]) -> "CubeBasedCollaborativeFilteringRecommender":
         """
         Train the recommender on a list of cube models.
 
-        This builds an index of which cards appear in which cubes,
-        enabling efficient similarity calculations during recommendation.
+        This builds a sparse cube-card matrix of which cards appear in which
+        cubes, enabling efficient similarity calculations during
+        recommendation. The set-based cube_cards, card_cubes and all_card_ids
+        indices are derived from it on first access.
 
         Args:
             cubes: List of CubeModel instances to train on
@@ -108,25 +145,25 @@ class CubeBasedCollaborativeFilteringRecommender(Recommender):
             raise ValueError("Cannot fit on empty cube list")
 
         # Reset state
-        self.cube_cards = {}
-        self.card_cubes = defaultdict(set)
-        self.card_names = {}
-        self.all_card_ids = set()
-
-        # Build cube-card and card-cube indices
-        for cube in cubes:
-            card_ids = self._extract_card_ids(cube)
-            self.cube_cards[cube.id] = card_ids
-            self.all_card_ids.update(card_ids)
-
-            # Build reverse index: card -> cubes
-            for card_id in card_ids:
-                self.card_cubes[card_id].add(cube.id)
+        self._similar_cubes_cache = OrderedDict()
+        for name in self._DERIVED_INDICES:
+            self.__dict__.pop(name, None)
+
+        # Freeze the training set as a binary cube-card matrix so similarity
+        # against all cubes is a single sparse matrix-vector product
+        self.cube_card_matrix, self.card_to_col, self.cube_to_row = generate_sparse_cf_matrix(
+            cubes, binary=True
+        )
+        self.row_cube_ids = [cube.id for cube in cubes]
+        # Binary rows, so each cube's size is just its stored entry count
+        self.cube_sizes = np.diff(self.cube_card_matrix.indptr)
+        # card_to_col is in column order, so this maps columns back to card IDs
+        self.col_card_ids = np.fromiter(self.card_to_col, dtype=np.int64, count=len(self.card_to_col))
 
         # Store metadata
         self.model_data['num_cubes'] = len(cubes)
-        self.model_data['num_cards'] = len(self.all_card_ids)
-        self.model_data['avg_cube_size'] = np.mean([len(cards) for cards in self.cube_cards.values()])
+        self.model_data['num_cards'] = len(self.card_to_col)
+        self.model_data['avg_cube_size'] = float(self.cube_sizes.mean())
 
         self.is_fitted = True
         return self
@@ -134,13 +171,17 @@ class CubeBasedCollaborativeFilteringRecommender(Recommender):
     def _find_similar_cubes(
         self,
         target_cube_id: str,
-        target_cards: Set[str],
+        target_cards: FrozenSet[int],
         n_similar: Optional[int] = None,
         min_similarity: Optional[float] = None
     ) -> List[tuple[str, float]]:
         """
         Find cubes most similar to the target cube.
 
+        Intersections with every training cube are computed with one sparse
+        matrix-vector product, and unions follow from |A| + |B| - |A ∩ B|.
+        Results are cached per target card set until the next fit().
+
         Args:
             target_cube_id: ID of the target cube (to exclude from results)
             target_cards: Set of card IDs in the target cube
@@ -155,22 +196,52 @@ class CubeBasedCollaborativeFilteringRecommender(Recommender):
         if min_similarity is None:
             min_similarity = self.config.min_similarity
 
-        similarities = []
-
-        for cube_id, cube_cards in self.cube_cards.items():
-            # Skip the target cube itself
-            if cube_id == target_cube_id:
-                continue
-
-            similarity = self._calculate_jaccard_similarity(target_cards, cube_cards)
-
-            # Only consider cubes above the minimum similarity threshold
-            if similarity >= min_similarity:
-                similarities.append((cube_id, similarity))
+        # frozenset() is a no-op for the frozen sets recommend() passes in
+        cache_key = (target_cube_id, frozenset(target_cards), n_similar, min_similarity)
+        cached = self._similar_cubes_cache.get(cache_key)
+        if cached is not None:
+            self._similar_cubes_cache.move_to_end(cache_key)
+            return cached
+
+        # Indicator vector of the target's cards over the training vocabulary
+        target_vector = np.zeros(len(self.card_to_col), dtype=np.int32)
+        target_cols = [self.card_to_col[c] for c in target_cards if c in self.card_to_col]
+        target_vector[target_cols] = 1
+
+        intersections = self.cube_card_matrix @ target_vector
+        unions = self.cube_sizes + len(target_cards) - intersections
+        similarities = np.divide(
+            intersections,
+            unions,
+            out=np.zeros(len(unions), dtype=np.float64),
+            where=unions > 0
+        )
 
-        # Sort by similarity descending and take top n
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:n_similar]
+        # Only consider cubes above the minimum similarity threshold,
+        # skipping the target cube itself
+        candidates = similarities >= min_similarity
+        target_row = self.cube_to_row.get(target_cube_id)
+        if target_row is not None:
+            candidates[target_row] = False
+        candidate_rows = np.flatnonzero(candidates)
+
+        # Partition out the top n candidates (O(N)), then sort only those by
+        # similarity descending, ties in training order
+        k = min(n_similar, len(candidate_rows))
+        if k < len(candidate_rows):
+            kth = -np.partition(-similarities[candidate_rows], k - 1)[k - 1]
+            # Keep every candidate tied with the n-th score so ties resolve
+            # by training order exactly as a full stable sort would
+            candidate_rows = candidate_rows[similarities[candidate_rows] >= kth]
+        order = np.argsort(-similarities[candidate_rows], kind='stable')
+        top_rows = candidate_rows[order[:k]]
+
+        similar = [(self.row_cube_ids[row], float(similarities[row])) for row in top_rows]
+
+        self._similar_cubes_cache[cache_key] = similar
+        if len(self._similar_cubes_cache) > self.SIMILAR_CUBES_CACHE_SIZE:
+            self._similar_cubes_cache.popitem(last=False)
+        return similar
 
     def recommend(
         self,
@@ -193,8 +264,7 @@ class CubeBasedCollaborativeFilteringRecommender(Recommender):
         Returns:
             List of dictionaries containing recommended cards with scores.
             Each dictionary contains:
-            - 'card_id': Card identifier (oracle_id or name)
-            - 'card_name': Card name
+            - 'card_id': Integer card ID, as used in the cube dump
             - 'score': Recommendation score (0.0 to 1.0)
             - 'reason': Explanation for the recommendation
 
@@ -226,45 +296,55 @@ class CubeBasedCollaborativeFilteringRecommender(Recommender):
             # No similar cubes found, return empty recommendations
             return []
 
-        # Calculate scores for candidate cards
-        card_scores: Dict[str, float] = defaultdict(float)
-        card_appearance_count: Dict[str, int] = defaultdict(int)
-
-        total_similarity = sum(sim for _, sim in similar_cubes)
-
-        for cube_id, similarity in similar_cubes:
-            cube_card_set = self.cube_cards[cube_id]
-
-            # Consider cards in this similar cube that are NOT in target cube
-            candidate_cards = cube_card_set - target_cards
+        # Score every card at once: the similarity-weighted sum of the similar
+        # cubes' rows, and their unweighted sum for appearance counts
+        similar_rows = np.fromiter(
+            (self.cube_to_row[cube_id] for cube_id, _ in similar_cubes),
+            dtype=np.int64,
+            count=len(similar_cubes)
+        )
+        weights = np.fromiter(
+            (similarity for _, similarity in similar_cubes),
+            dtype=np.float64,
+            count=len(similar_cubes)
+        )
+        similar_matrix = self.cube_card_matrix[similar_rows]
+        card_scores = similar_matrix.T @ weights
+        card_appearance_count = np.asarray(similar_matrix.sum(axis=0, dtype=np.int32)).ravel()
 
-            for card_id in candidate_cards:
-                # Weight by cube similarity
-                card_scores[card_id] += similarity
-                card_appearance_count[card_id] += 1
+        # Consider cards in the similar cubes that are NOT in the target cube
+        target_cols = [self.card_to_col[c] for c in target_cards if c in self.card_to_col]
+        card_appearance_count[target_cols] = 0
+        candidate_cols = np.flatnonzero(card_appearance_count)
 
         # Normalize scores by total similarity
+        total_similarity = weights.sum()
         if total_similarity > 0:
-            for card_id in card_scores:
-                card_scores[card_id] /= total_similarity
-
-        # Sort by score descending
-        sorted_cards = sorted(
-            card_scores.items(),
-            key=lambda x: (x[1], card_appearance_count[x[0]]),
-            reverse=True
-        )
+            card_scores /= total_similarity
+
+        # Keep only candidates scoring at least the n-th best score, then sort
+        # by score and appearance count descending, ties by card ID
+        if n_recommendations < len(candidate_cols):
+            candidate_scores = card_scores[candidate_cols]
+            kth = -np.partition(-candidate_scores, n_recommendations - 1)[n_recommendations - 1]
+            candidate_cols = candidate_cols[candidate_scores >= kth]
+        order = np.lexsort((
+            self.col_card_ids[candidate_cols],
+            -card_appearance_count[candidate_cols],
+            -card_scores[candidate_cols]
+        ))
+        top_cols = candidate_cols[order[:n_recommendations]]
 
         # Build recommendations
         recommendations = []
-        for card_id, score in sorted_cards[:n_recommendations]:
-            card_name = self.card_names.get(card_id, card_id)
-            num_appearances = card_appearance_count[card_id]
-            num_similar_cubes = len(similar_cubes)
+        num_similar_cubes = len(similar_cubes)
+        for col in top_cols.tolist():
+            card_id = int(self.col_card_ids[col])
+            score = float(card_scores[col])
+            num_appearances = int(card_appearance_count[col])
 
             recommendations.append({
                 'card_id': card_id,
-                'card_name': card_name,
                 'score': round(score, 4),
                 'reason': (
                     f"Appears in {num_appearances}/{num_similar_cubes} similar cubes "
@@ -7,7 +7,6 @@ algorithms.
 """
 
 from typing import List, Tuple, Dict, Literal
-from collections import defaultdict
 from scipy.sparse import csr_matrix, diags
 import numpy as np
 
@@ -64,46 +63,38 @@ def generate_sparse_cf_matrix(
     if not cubes:
         raise ValueError("Cannot generate matrix from empty cube list")
 
-    # Build mappings
-    cube_to_row: Dict[str, int] = {}
-    card_to_col: Dict[int, int] = {}
-    card_counts: Dict[Tuple[int, int], int] = defaultdict(int)
-
-    # First pass: build cube and card indices
-    for cube_idx, cube in enumerate(cubes):
-        cube_to_row[cube.id] = cube_idx
+    n_cubes = len(cubes)
+    cube_to_row: Dict[str, int] = {cube.id: cube_idx for cube_idx, cube in enumerate(cubes)}
 
-        # Count cards in this cube
-        for card_id in cube.card_ids:
-            # Add card to column mapping if not already present
-            if card_id not in card_to_col:
-                card_to_col[card_id] = len(card_to_col)
+    # Flatten every cube's card IDs into one COO entry list: one row index
+    # per card occurrence, repeated by cube size
+    cube_sizes = np.fromiter((len(cube.card_ids) for cube in cubes), dtype=np.int64, count=n_cubes)
+    all_card_ids = np.concatenate([cube.card_ids for cube in cubes])
+    rows = np.repeat(np.arange(n_cubes, dtype=np.int32), cube_sizes)
 
-            # Track card counts for this cube
-            col_idx = card_to_col[card_id]
-            card_counts[(cube_idx, col_idx)] += 1
+    # Number columns by first appearance across the cubes
+    unique_ids, first_index, inverse = np.unique(
+        all_card_ids, return_index=True, return_inverse=True
+    )
+    col_order = np.argsort(first_index, kind='stable')
+    unique_to_col = np.empty(len(unique_ids), dtype=np.int32)
+    unique_to_col[col_order] = np.arange(len(unique_ids), dtype=np.int32)
+    cols = unique_to_col[inverse.ravel()]
 
-    # Build sparse matrix in COO format (coordinate format)
-    # then convert to CSR for efficient operations
-    n_cubes = len(cubes)
+    card_to_col: Dict[int, int] = dict(zip(unique_ids[col_order].tolist(), range(len(unique_ids))))
     n_cards = len(card_to_col)
 
-    # Prepare data for sparse matrix construction
-    rows = []
-    cols = []
-    data = []
-
-    for (cube_idx, card_idx), count in card_counts.items():
-        rows.append(cube_idx)
-        cols.append(card_idx)
-        data.append(1 if binary else count)
-
-    # Create sparse matrix
+    # Build sparse matrix in COO format (coordinate format) then convert
+    # to CSR; summing duplicate entries yields each card's count per cube
     matrix = csr_matrix(
-        (data, (rows, cols)),
+        (np.ones(len(all_card_ids), dtype=np.int32), (rows, cols)),
         shape=(n_cubes, n_cards),
         dtype=np.int32
     )
+    matrix.sum_duplicates()
+
+    if binary:
+        matrix.data[:] = 1
 
     return matrix, card_to_col, cube_to_row
 
@@ -201,37 +192,32 @@ def calculate_card_similarities(
 
         # Create diagonal matrix with 1/sqrt(count) for normalization
         # Handle zero counts to avoid division by zero
-        inv_sqrt_counts = np.zeros(n_cards)
+        inv_sqrt_counts = np.zeros(n_cards, dtype=np.float32)
         nonzero_mask = card_counts > 0
         inv_sqrt_counts[nonzero_mask] = 1.0 / np.sqrt(card_counts[nonzero_mask])
 
         # Create sparse diagonal matrix for normalization
-        normalizer = diags(inv_sqrt_counts, format='csr')
+        normalizer = diags(inv_sqrt_counts, format='csr', dtype=np.float32)
 
         # Similarity = D^-0.5 @ C @ D^-0.5
         # where D is diagonal matrix of counts, C is co-occurrence
-        similarity = normalizer @ cooccurrence_matrix @ normalizer
+        similarity = normalizer @ cooccurrence_matrix.astype(np.float32) @ normalizer
 
     elif metric == "jaccard":
         # Jaccard similarity: intersection / union
         # |A ∩ B| / |A ∪ B| = cooccur(i,j) / (count(i) + count(j) - cooccur(i,j))
 
-        # Convert to dense for easier computation (consider keeping sparse for large matrices)
-        cooccur_dense = cooccurrence_matrix.toarray()
-
-        # Create union matrix: count[i] + count[j] for all pairs
-        union = card_counts[:, np.newaxis] + card_counts[np.newaxis, :]
-
-        # Jaccard = intersection / union
-        # union - intersection gives us the adjustment needed
-        with np.errstate(divide='ignore', invalid='ignore'):
-            similarity_dense = np.divide(
-                cooccur_dense,
-                union - cooccur_dense,
-                where=(union - cooccur_dense) > 0
-            )
-            similarity_dense = np.nan_to_num(similarity_dense, 0.0)
-
-        similarity = csr_matrix(similarity_dense)
+        # Only pairs that co-occur have a nonzero similarity, so compute the
+        # score for the stored entries alone and keep the result sparse
+        coo = cooccurrence_matrix.tocoo()
+        union = card_counts[coo.row] + card_counts[coo.col] - coo.data
+        data = np.divide(
+            coo.data,
+            union,
+            out=np.zeros(len(coo.data), dtype=np.float32),
+            where=union > 0
+        )
+
+        similarity = csr_matrix((data, (coo.row, coo.col)), shape=cooccurrence_matrix.shape)
 
     return similarity.tocsr()
@@ -0,0 +1,119 @@
+"""Tests for the cube-based collaborative filtering recommender."""
+
+import random
+from fractions import Fraction
+
+import pytest
+
+from app.models.cube import CUBE_ADAPTER
+from app.models.recommender import CubeBasedCollaborativeFilteringConfig
+from app.services.recommender import CubeBasedCollaborativeFilteringRecommender
+
+
+def make_cube(cube_id, cards):
+    return CUBE_ADAPTER.validate_python({"shortId": cube_id, "name": cube_id, "cards": cards})
+
+
+def reference_recommend(training_cubes, target, n_similar, min_similarity, n_recommendations):
+    """Set-based Jaccard recommender with exact arithmetic, as documented."""
+    target_cards = set(target.card_ids.tolist())
+
+    similar = []
+    for cube in training_cubes:
+        if cube.id == target.id:
+            continue
+        cards = set(cube.card_ids.tolist())
+        union = len(cards | target_cards)
+        similarity = Fraction(len(cards & target_cards), union) if union else Fraction(0)
+        if similarity >= min_similarity:
+            similar.append((cards, similarity))
+    # Stable sort, so ties keep training order
+    similar.sort(key=lambda pair: -pair[1])
+    similar = similar[:n_similar]
+    if not similar:
+        return []
+
+    total = sum(similarity for _, similarity in similar)
+    scores: dict[int, Fraction] = {}
+    counts: dict[int, int] = {}
+    for cards, similarity in similar:
+        for card in cards - target_cards:
+            scores[card] = scores.get(card, Fraction(0)) + similarity
+            counts[card] = counts.get(card, 0) + 1
+    if total > 0:
+        scores = {card: score / total for card, score in scores.items()}
+
+    ranked = sorted(scores, key=lambda card: (-scores[card], -counts[card], card))
+    return [(card, round(float(scores[card]), 4)) for card in ranked[:n_recommendations]]
+
+
+def as_pairs(recommendations):
+    return [(rec["card_id"], rec["score"]) for rec in recommendations]
+
+
+@pytest.fixture
+def tie_cubes():
+    # Against the target {1, 2, 3, 4}: x has similarity 1/2, y and z 1/4 each
+    return [
+        make_cube("target", [1, 2, 3, 4]),
+        make_cube("x", [1, 2, 3, 4, 13, 12, 11, 10]),
+        make_cube("y", [1, 2, 20, 21, 22, 23]),
+        make_cube("z", [3, 4, 20, 24, 25, 26]),
+    ]
+
+
+def test_ties_break_by_appearances_then_card_id(tie_cubes):
+    recommender = CubeBasedCollaborativeFilteringRecommender().fit(tie_cubes)
+    recommendations = recommender.recommend(tie_cubes[0], n_recommendations=20)
+
+    # Card 20 ties cards 10-13 on score (1/4 + 1/4 vs 1/2) but appears in two
+    # similar cubes; equal scores and counts are ordered by card ID
+    assert [rec["card_id"] for rec in recommendations] == [20, 10, 11, 12, 13, 21, 22, 23, 24, 25, 26]
+    assert recommendations[0]["score"] == 0.5
+    assert as_pairs(recommendations) == reference_recommend(tie_cubes, tie_cubes[0], 50, 0.0, 20)
+
+
+def test_similar_cube_ties_keep_training_order(tie_cubes):
+    config = CubeBasedCollaborativeFilteringConfig(n_similar_cubes=2)
+    recommender = CubeBasedCollaborativeFilteringRecommender(config).fit(tie_cubes)
+
+    # y and z tie for the second slot, and y comes first in training order
+    similar = recommender._find_similar_cubes("target", frozenset({1, 2, 3, 4}))
+    assert similar == [("x", 0.5), ("y", 0.25)]
+    assert as_pairs(recommender.recommend(tie_cubes[0], n_recommendations=20)) == (
+        reference_recommend(tie_cubes, tie_cubes[0], 2, 0.0, 20)
+    )
+
+
+@pytest.mark.parametrize("n_similar, min_similarity", [(50, 0.0), (5, 0.0), (20, 0.1)])
+def test_matches_set_based_jaccard_reference(n_similar, min_similarity):
+    rng = random.Random(7)
+    cubes = [
+        make_cube(f"c{i}", rng.sample(range(60), rng.randrange(1, 25)))
+        for i in range(80)
+    ]
+    config = CubeBasedCollaborativeFilteringConfig(
+        n_similar_cubes=n_similar, min_similarity=min_similarity
+    )
+    recommender = CubeBasedCollaborativeFilteringRecommender(config).fit(cubes)
+
+    # Training cubes (excluded from their own neighbours) and unseen cubes
+    targets = cubes[:20] + [make_cube(f"new{i}", rng.sample(range(70), 10)) for i in range(5)]
+    for target in targets:
+        expected = reference_recommend(cubes, target, n_similar, Fraction(str(min_similarity)), 10)
+        assert as_pairs(recommender.recommend(target, n_recommendations=10)) == expected
+
+
+def test_pickle_round_trip_keeps_recommendations(tmp_path, tie_cubes):
+    recommender = CubeBasedCollaborativeFilteringRecommender().fit(tie_cubes)
+    before = recommender.recommend(tie_cubes[0], n_recommendations=5)
+
+    path = tmp_path / "model.pkl"
+    recommender.save(path)
+    loaded = CubeBasedCollaborativeFilteringRecommender.load(path)
+
+    assert loaded.is_fitted
+    assert loaded.recommend(tie_cubes[0], n_recommendations=5) == before
+    assert loaded.recommend(tie_cubes[1], n_recommendations=5) == (
+        recommender.recommend(tie_cubes[1], n_recommendations=5)
+    )
@@ -0,0 +1,64 @@
+"""Tests for the CubeDatabase pickle cache and its invalidation key."""
+
+import os
+
+import orjson
+import pytest
+
+from app.models.cube import CubeModel
+from app.services import cube_database
+from app.services.cube_database import CUBE_CACHE_PATH, LOCAL_DATA_PATH, CubeDatabase
+
+CUBES = [
+    {"shortId": "a", "name": "Alpha", "cards": [1, 2, 3]},
+    {"shortId": "b", "name": "Beta", "cards": [2, 3, 4]},
+]
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(CubeDatabase, "_is_s3_file_newer", lambda self: False)
+    LOCAL_DATA_PATH.parent.mkdir(parents=True)
+    LOCAL_DATA_PATH.write_bytes(orjson.dumps(CUBES))
+    return tmp_path
+
+
+def test_key_changes_with_cache_version(data_dir, monkeypatch):
+    key = CubeDatabase._cube_cache_key(LOCAL_DATA_PATH)
+    monkeypatch.setattr(cube_database, "CUBE_CACHE_VERSION", cube_database.CUBE_CACHE_VERSION + 1)
+    assert CubeDatabase._cube_cache_key(LOCAL_DATA_PATH) != key
+
+
+def test_key_changes_with_field_annotations(data_dir, monkeypatch):
+    key = CubeDatabase._cube_cache_key(LOCAL_DATA_PATH)
+    name_field = CubeModel.model_fields["name"]
+    monkeypatch.setattr(name_field, "annotation", "str | None")
+    assert CubeDatabase._cube_cache_key(LOCAL_DATA_PATH) != key
+
+
+def test_key_changes_with_source_mtime(data_dir):
+    key = CubeDatabase._cube_cache_key(LOCAL_DATA_PATH)
+    assert CubeDatabase._cube_cache_key(LOCAL_DATA_PATH) == key
+    mtime_ns = LOCAL_DATA_PATH.stat().st_mtime_ns
+    os.utime(LOCAL_DATA_PATH, ns=(mtime_ns, mtime_ns - 10**9))
+    assert CubeDatabase._cube_cache_key(LOCAL_DATA_PATH) != key
+
+
+def test_warm_start_loads_the_cache(data_dir, monkeypatch):
+    first = CubeDatabase()
+    assert CUBE_CACHE_PATH.exists()
+
+    # The dump is not parsed again while the cache key still matches
+    monkeypatch.setattr(CubeDatabase, "_load_full_data", lambda self: pytest.fail("dump re-parsed"))
+    second = CubeDatabase()
+    assert second.cube_index == first.cube_index
+
+
+def test_stale_cache_is_rebuilt(data_dir):
+    CubeDatabase()
+    LOCAL_DATA_PATH.write_bytes(orjson.dumps(CUBES[:1]))
+    mtime_ns = LOCAL_DATA_PATH.stat().st_mtime_ns
+    os.utime(LOCAL_DATA_PATH, ns=(mtime_ns, mtime_ns + 10**9))
+
+    assert list(CubeDatabase().cube_index) == ["a"]
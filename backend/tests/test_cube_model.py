@@ -0,0 +1,32 @@
+"""Regression tests for CubeModel equality and hashing."""
+
+import numpy as np
+
+from app.models.cube import CUBE_ADAPTER, construct_cube
+
+
+ROW = {"shortId": "abc12", "name": "Test Cube", "cards": [1, 2, 3], "tags": ["vintage"]}
+
+
+def test_equal_cubes_compare_equal():
+    assert CUBE_ADAPTER.validate_python(ROW) == construct_cube(ROW)
+
+
+def test_different_card_ids_compare_unequal():
+    other = {**ROW, "cards": [1, 2, 4]}
+    assert CUBE_ADAPTER.validate_python(ROW) != CUBE_ADAPTER.validate_python(other)
+    shorter = {**ROW, "cards": [1, 2]}
+    assert CUBE_ADAPTER.validate_python(ROW) != CUBE_ADAPTER.validate_python(shorter)
+
+
+def test_different_fields_compare_unequal():
+    other = {**ROW, "name": "Other Cube"}
+    assert CUBE_ADAPTER.validate_python(ROW) != CUBE_ADAPTER.validate_python(other)
+
+
+def test_equal_cubes_hash_equal():
+    first = CUBE_ADAPTER.validate_python(ROW)
+    second = construct_cube(ROW)
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert first.card_ids.dtype == np.int32
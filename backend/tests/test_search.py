@@ -0,0 +1,64 @@
+"""Tests for card and cube name search result order."""
+
+import orjson
+import pytest
+
+from app.services.card_database import CardDatabase
+from app.services.cube_database import CubeDatabase
+
+# In load order; prefix matches for "bolt" come back in name order, then the
+# remaining substring matches in load order
+NAMES = ["Lightning Bolt", "Boltwave", "Chain Lightning", "Bolt of Doom", "Firebolt", "Counterspell", "bolt"]
+
+
+@pytest.fixture
+def card_db(tmp_path):
+    cards = [
+        {
+            "id": str(i), "name": name, "cmc": 1.0, "type_line": "Instant",
+            "set": "m21", "set_name": "Core Set 2021", "rarity": "common",
+            "scryfall_uri": "https://scryfall.com", "legalities": {"modern": "legal"},
+        }
+        for i, name in enumerate(NAMES)
+    ]
+    db = CardDatabase(tmp_path)
+    db.oracle_cards_path.write_bytes(orjson.dumps(cards))
+    db._load_cards()
+    return db
+
+
+@pytest.fixture
+def cube_db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(CubeDatabase, "_is_s3_file_newer", lambda self: False)
+    dump = tmp_path / "data" / "cube" / "cube_data_dump.json"
+    dump.parent.mkdir(parents=True)
+    dump.write_bytes(orjson.dumps(
+        [{"shortId": f"c{i}", "name": name, "cards": [i]} for i, name in enumerate(NAMES)]
+    ))
+    return CubeDatabase()
+
+
+def test_card_search_returns_prefix_matches_first(card_db):
+    names = [card.name for card in card_db.search_cards("BOLT", limit=10)]
+    assert names == ["bolt", "Bolt of Doom", "Boltwave", "Lightning Bolt", "Firebolt"]
+
+
+def test_card_search_limit_cuts_prefix_then_substring_matches(card_db):
+    assert [card.name for card in card_db.search_cards("bolt", limit=2)] == ["bolt", "Bolt of Doom"]
+    assert [card.name for card in card_db.search_cards("bolt", limit=4)] == (
+        ["bolt", "Bolt of Doom", "Boltwave", "Lightning Bolt"]
+    )
+
+
+def test_card_search_substring_only_and_empty_query(card_db):
+    assert [card.name for card in card_db.search_cards("lightning")] == ["Lightning Bolt", "Chain Lightning"]
+    assert [card.name for card in card_db.search_cards("", limit=2)] == NAMES[:2]
+    assert card_db.search_cards("bolt\nfire") == []
+
+
+def test_cube_search_returns_prefix_matches_first(cube_db):
+    names = [cube.name for cube in cube_db.search_cubes("Bolt", limit=10)]
+    assert names == ["bolt", "Bolt of Doom", "Boltwave", "Lightning Bolt", "Firebolt"]
+    assert [cube.name for cube in cube_db.search_cubes("bolt", limit=3)] == ["bolt", "Bolt of Doom", "Boltwave"]
+    assert [cube.name for cube in cube_db.search_cubes("lightning")] == ["Lightning Bolt", "Chain Lightning"]
@@ -0,0 +1,44 @@
+"""
+Shared helper for extracting window.reactProps from CubeCobra pages.
+Used by inspect_search.py and inspect_cube.py.
+"""
+
+import json
+import re
+
+# Same matches as \bundefined\b, but starting with the literal lets the
+# regex engine skip ahead to candidates instead of testing every position
+UNDEFINED_PATTERN = re.compile(r'undefined\b(?<!\wundefined)')
+
+# raw_decode parses one JSON value off the front of a string and reports
+# where it ended, so it finds the end of the reactProps object itself and
+# braces inside string literals are never mistaken for the end
+JSON_DECODER = json.JSONDecoder()
+
+
+def extract_react_props(html_content):
+    """Extract window.reactProps from the HTML."""
+    # The marker only appears in the inline script that assigns it, so scan
+    # the raw HTML for it instead of building a DOM to find the script tag
+    marker = html_content.find('window.reactProps')
+    if marker < 0:
+        return None
+
+    # Extract the JSON object assigned to window.reactProps:
+    # window.reactProps = {...};
+    start = html_content.find('{', marker)
+    if start < 0:
+        return None
+    end = html_content.find('</script>', start)
+    if end < 0:
+        end = len(html_content)
+
+    # Replace JavaScript undefined with JSON null
+    json_str = UNDEFINED_PATTERN.sub('null', html_content[start:end])
+    try:
+        react_props, _ = JSON_DECODER.raw_decode(json_str)
+        return react_props
+    except json.JSONDecodeError as e:
+        print(f"Error parsing reactProps JSON: {e}")
+        print(f"First 500 chars of JSON: {json_str[:500]}")
+        return None
@@ -4,86 +4,97 @@ Extracts window.ReactProps from the page which contains all the cube data.
 Can process a single cube or a list of cube shortIDs from a JSON file.
 """
 
+import asyncio
 import json
-import re
 import time
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import orjson
 from pathlib import Path
 
+from _react_props import extract_react_props
+
 # Configuration
 INPUT_SHORT_IDS_FILE = 'output_cube_short_ids.json'  # File with list of shortIDs
 OUTPUT_DIR = 'cube_data'  # Directory to save cube data
 RATE_LIMIT_DELAY = 0.5  # Delay between requests in seconds (2 requests per second)
+MAX_CONCURRENT_REQUESTS = 4  # Requests in flight at once, so slow responses overlap
 
 
-def extract_react_props(html_content):
-    """Extract window.ReactProps from the HTML."""
-    soup = BeautifulSoup(html_content, 'html.parser')
-
-    # Find all script tags in the body
-    body = soup.find('body')
-    if not body:
-        return None
-
-    scripts = body.find_all('script')
-
-    for script in scripts:
-        if script.string and 'window.reactProps' in script.string:
-            # Extract the JSON object assigned to window.ReactProps
-            # Pattern: window.ReactProps = {...};
-            match = re.search(r'window\.reactProps\s*=\s*(\{.*?\});', script.string, re.DOTALL)
-            if match:
-                json_str = match.group(1)
-                # Replace JavaScript undefined with JSON null
-                json_str = re.sub(r'\bundefined\b', 'null', json_str)
-                try:
-                    return json.loads(json_str)
-                except json.JSONDecodeError as e:
-                    print(f"Error parsing ReactProps JSON: {e}")
-                    print(f"First 500 chars of JSON: {json_str[:500]}")
-                    return None
-
-    return None
-
-
-def fetch_cube_data(cube_id, headers, output_dir):
+async def fetch_cube_data(client, cube_id, output_dir):
     """Fetch and save data for a single cube."""
     url = f'https://cubecobra.com/cube/overview/{cube_id}'
     print(f"  Fetching: {url}")
 
     try:
-        response = requests.get(url, headers=headers)
+        response = await client.get(url)
         response.raise_for_status()
 
-        # Extract ReactProps
-        react_props = extract_react_props(response.text)
+        # Extract ReactProps off the event loop so other fetches keep going
+        react_props = await asyncio.to_thread(extract_react_props, response.text)
 
         if react_props:
             # Save ReactProps as JSON
             output_file = output_dir / f'{cube_id}.json'
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(react_props, f, indent=2)
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(react_props, option=orjson.OPT_INDENT_2))
 
             # Print cube info
             if 'cube' in react_props:
                 cube = react_props['cube']
                 name = cube.get('name', 'Unknown')
                 card_count = cube.get('card_count', 0)
-                print(f"    ✓ {name} ({card_count} cards)")
+                print(f"    ✓ {cube_id}: {name} ({card_count} cards)")
             else:
-                print(f"    ✓ Saved")
+                print(f"    ✓ {cube_id}: Saved")
 
             return True
         else:
-            print(f"    ✗ Could not find window.reactProps")
+            print(f"    ✗ {cube_id}: Could not find window.reactProps")
             return False
 
-    except requests.exceptions.RequestException as e:
-        print(f"    ✗ Error: {e}")
+    except httpx.HTTPError as e:
+        print(f"    ✗ {cube_id}: Error: {e}")
         return False
 
 
+async def fetch_all_cube_data(short_ids, headers, output_dir):
+    """
+    Fetch every cube concurrently, starting at most one request per
+    RATE_LIMIT_DELAY seconds with up to MAX_CONCURRENT_REQUESTS in flight.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    # Shared limiter: the earliest time the next request may start. Workers
+    # claim start times one at a time under the lock, so requests stay at
+    # least RATE_LIMIT_DELAY apart however long they queued on the semaphore
+    loop = asyncio.get_running_loop()
+    rate_lock = asyncio.Lock()
+    next_start = loop.time()
+
+    async def wait_for_start_slot():
+        nonlocal next_start
+        async with rate_lock:
+            delay = next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_start = loop.time() + RATE_LIMIT_DELAY
+
+    # One pooled client for every request, so connections (and their TLS
+    # handshakes) are reused; httpx asks for gzip-compressed responses by default
+    limits = httpx.Limits(
+        max_connections=MAX_CONCURRENT_REQUESTS,
+        max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+    )
+    async with httpx.AsyncClient(headers=headers, http2=True, timeout=30.0, limits=limits) as client:
+        async def worker(i, cube_id):
+            async with semaphore:
+                await wait_for_start_slot()
+                print(f"[{i + 1}/{len(short_ids)}] {cube_id}")
+                return await fetch_cube_data(client, cube_id, output_dir)
+
+        return await asyncio.gather(*(worker(i, cube_id) for i, cube_id in enumerate(short_ids)))
+
+
 def main():
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -103,17 +114,9 @@ def main():
         print(f"Found {len(short_ids)} cube shortIDs")
         print(f"Fetching cube data (rate limited to 2 requests/second)...\n")
 
-        success_count = 0
         start_time = time.time()
-
-        for i, cube_id in enumerate(short_ids, 1):
-            print(f"[{i}/{len(short_ids)}] {cube_id}")
-            if fetch_cube_data(cube_id, headers, output_dir):
-                success_count += 1
-
-            # Rate limiting: wait before next request (except for the last one)
-            if i < len(short_ids):
-                time.sleep(RATE_LIMIT_DELAY)
+        results = asyncio.run(fetch_all_cube_data(short_ids, headers, output_dir))
+        success_count = sum(results)
 
         elapsed_time = time.time() - start_time
         print(f"\n{'='*60}")
@@ -4,43 +4,19 @@ Extracts shortIDs for later detailed fetching.
 """
 
 import json
-import re
 import requests
-from bs4 import BeautifulSoup
+
+from _react_props import extract_react_props
 
 # Configuration
 SEARCH_URL = 'https://cubecobra.com/search'
 OUTPUT_SHORT_IDS = 'output_cube_short_ids.json'
 
-
-def extract_react_props(html_content):
-    """Extract window.reactProps from the HTML."""
-    soup = BeautifulSoup(html_content, 'html.parser')
-
-    # Find all script tags in the body
-    body = soup.find('body')
-    if not body:
-        return None
-
-    scripts = body.find_all('script')
-
-    for script in scripts:
-        if script.string and 'window.reactProps' in script.string:
-            # Extract the JSON object assigned to window.reactProps
-            # Pattern: window.reactProps = {...};
-            match = re.search(r'window\.reactProps\s*=\s*(\{.*?\});', script.string, re.DOTALL)
-            if match:
-                json_str = match.group(1)
-                # Replace JavaScript undefined with JSON null
-                json_str = re.sub(r'\bundefined\b', 'null', json_str)
-                try:
-                    return json.loads(json_str)
-                except json.JSONDecodeError as e:
-                    print(f"Error parsing reactProps JSON: {e}")
-                    print(f"First 500 chars of JSON: {json_str[:500]}")
-                    return None
-
-    return None
+# Shared session so repeated requests reuse the pooled TLS connection
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
 
 
 def extract_short_ids(react_props):
@@ -62,12 +38,8 @@ def extract_short_ids(react_props):
 def main():
     print(f"Fetching cube shortIDs from {SEARCH_URL}...")
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-
     try:
-        response = requests.get(SEARCH_URL, headers=headers)
+        response = SESSION.get(SEARCH_URL)
         response.raise_for_status()
 
         print(f"Status: {response.status_code}")
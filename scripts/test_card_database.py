@@ -44,11 +44,11 @@ async def main():
     print("-" * 80)
     card = db.get_card_by_name("Lightning Bolt")
     if card:
-        print(f"Found: {card.get('name')}")
-        print(f"  Type: {card.get('type_line')}")
-        print(f"  Mana Cost: {card.get('mana_cost', 'N/A')}")
-        print(f"  Oracle Text: {card.get('oracle_text', 'N/A')}")
-        print(f"  Set: {card.get('set_name', 'N/A')} ({card.get('set', 'N/A')})")
+        print(f"Found: {card.name}")
+        print(f"  Type: {card.type_line}")
+        print(f"  Mana Cost: {card.mana_cost or 'N/A'}")
+        print(f"  Oracle Text: {card.oracle_text or 'N/A'}")
+        print(f"  Set: {card.set_name} ({card.set})")
     else:
         print("Not found")
     print()
@@ -59,7 +59,7 @@ async def main():
     print("-" * 80)
     results = db.search_cards("bolt", limit=5)
     for i, card in enumerate(results, 1):
-        print(f"{i}. {card.get('name')} - {card.get('type_line')}")
+        print(f"{i}. {card.name} - {card.type_line}")
     print()
 
     # Test 3: Search by Oracle ID
@@ -68,11 +68,11 @@ async def main():
     print("-" * 80)
     sol_ring = db.get_card_by_name("Sol Ring")
     if sol_ring:
-        oracle_id = sol_ring.get("oracle_id")
+        oracle_id = sol_ring.oracle_id
         printings = db.get_cards_by_oracle_id(oracle_id)
         print(f"Found {len(printings)} printings of Sol Ring:")
         for i, card in enumerate(printings[:5], 1):  # Show first 5
-            print(f"{i}. {card.get('set_name')} ({card.get('set')}) - {card.get('rarity')}")
+            print(f"{i}. {card.set_name} ({card.set}) - {card.rarity}")
         if len(printings) > 5:
             print(f"... and {len(printings) - 5} more")
     else:
@@ -84,14 +84,10 @@ async def main():
     print("Test 4: Database Statistics")
     print("-" * 80)
 
-    # Count unique oracle IDs
-    oracle_ids = set()
-    for card in db.cards:
-        if card.get("oracle_id"):
-            oracle_ids.add(card.get("oracle_id"))
-
+    # Count unique oracle IDs: the database already groups cards by Oracle ID
+    # (skipping cards without one), so no pass over every card is needed
     print(f"Total cards: {len(db.cards)}")
-    print(f"Unique Oracle IDs: {len(oracle_ids)}")
+    print(f"Unique Oracle IDs: {len(db.cards_by_oracle_id)}")
     print()
 
     print("=" * 80)